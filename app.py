@@ -150,19 +150,51 @@ class PreferenceStore:
     def _get_file_path(self, domain: str) -> Path:
         return self.data_dir / f"{domain}_preferences.jsonl"
     
+    @staticmethod
+    def _hash_and_serialize(record: PreferenceRecord) -> str:
+        """Assign record_hash and return the JSONL line; shared by single and bulk saves."""
+        content = f"{record.domain}|{record.prompt}|{record.annotator_id}|{record.timestamp}"
+        record.record_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+        return json.dumps(asdict(record), ensure_ascii=False) + "\n"
+    
     def save_record(self, record: PreferenceRecord) -> bool:
         try:
-            content = f"{record.domain}|{record.prompt}|{record.annotator_id}|{record.timestamp}"
-            record.record_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+            line = self._hash_and_serialize(record)
             file_path = self._get_file_path(record.domain)
             
             with open(file_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+                f.write(line)
             return True
         except Exception as e:
             print(f"Error saving record: {e}")
             return False
     
+    def save_records(self, records: List[PreferenceRecord]) -> bool:
+        """Append many records, opening each domain file once; all or nothing.
+
+        If any domain file fails, the files already written are truncated back
+        to their previous size so no domain is left half-saved.
+        """
+        written: List[Tuple[Path, int]] = []
+        try:
+            by_domain: Dict[str, List[str]] = {}
+            for record in records:
+                by_domain.setdefault(record.domain, []).append(self._hash_and_serialize(record))
+            for domain, lines in by_domain.items():
+                file_path = self._get_file_path(domain)
+                written.append((file_path, file_path.stat().st_size if file_path.exists() else 0))
+                with open(file_path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            return True
+        except Exception as e:
+            print(f"Error saving records: {e}")
+            for file_path, size in written:
+                try:
+                    os.truncate(file_path, size)
+                except OSError as rollback_error:
+                    print(f"Error rolling back {file_path}: {rollback_error}")
+            return False
+    
     def load_records(self, domain: str) -> List[dict]:
         file_path = self._get_file_path(domain)
         records = []
@@ -268,6 +300,30 @@ class PreferenceInput(BaseModel):
     response_b_model: str = ""
 
 
+class BulkPreferenceInput(BaseModel):
+    items: List[PreferenceInput]
+
+
+def record_from_input(pref: PreferenceInput, timestamp: str) -> PreferenceRecord:
+    """Build the stored record for an API submission (single or bulk)."""
+    return PreferenceRecord(
+        domain=pref.domain,
+        category=pref.category,
+        prompt=pref.prompt,
+        response_a=pref.response_a,
+        response_b=pref.response_b,
+        annotator_id=pref.annotator_id,
+        preference=pref.preference,
+        dimension_scores=pref.dimension_scores,
+        timestamp=timestamp,
+        record_hash="",
+        difficulty=pref.difficulty,
+        notes=pref.notes,
+        response_a_model=pref.response_a_model,
+        response_b_model=pref.response_b_model,
+    )
+
+
 class ExportRequest(BaseModel):
     format: Literal["jsonl", "dpo"] = "dpo"
     min_confidence: float = 0.0
@@ -350,28 +406,34 @@ async def api_submit_preference(
     if pref.domain not in DOMAINS:
         raise HTTPException(400, f"Invalid domain. Must be one of: {list(DOMAINS.keys())}")
     
-    record = PreferenceRecord(
-        domain=pref.domain,
-        category=pref.category,
-        prompt=pref.prompt,
-        response_a=pref.response_a,
-        response_b=pref.response_b,
-        annotator_id=pref.annotator_id,
-        preference=pref.preference,
-        dimension_scores=pref.dimension_scores,
-        timestamp=datetime.now().isoformat(),
-        record_hash="",
-        difficulty=pref.difficulty,
-        notes=pref.notes,
-        response_a_model=pref.response_a_model,
-        response_b_model=pref.response_b_model,
-    )
+    record = record_from_input(pref, datetime.now().isoformat())
     
     if store.save_record(record):
         return {"status": "saved", "hash": record.record_hash}
     raise HTTPException(500, "Failed to save preference")
 
 
+@app.post("/api/preferences/bulk")
+async def api_submit_preferences_bulk(
+    bulk: BulkPreferenceInput,
+    x_api_key: str = Header(default=None),
+):
+    """Submit many preferences in one request; all are validated before any is saved."""
+    if API_KEYS and x_api_key not in API_KEYS:
+        raise HTTPException(401, "Invalid API key")
+    
+    for i, pref in enumerate(bulk.items):
+        if pref.domain not in DOMAINS:
+            raise HTTPException(400, f"Invalid domain at item {i}. Must be one of: {list(DOMAINS.keys())}")
+    
+    timestamp = datetime.now().isoformat()
+    records = [record_from_input(pref, timestamp) for pref in bulk.items]
+    
+    if store.save_records(records):
+        return {"status": "saved", "saved": len(records), "hashes": [r.record_hash for r in records]}
+    raise HTTPException(500, "Failed to save preferences")
+
+
 @app.post("/api/export")
 async def api_export(
     req: ExportRequest,
@@ -626,6 +688,15 @@ X-API-Key: your-api-key (optional)
 }
 ```
 
+#### Submit Preferences (Bulk)
+```
+POST /api/preferences/bulk
+Content-Type: application/json
+X-API-Key: your-api-key (optional)
+
+{"items": [ <preference>, <preference>, ... ]}
+```
+
 #### Export Data (Premium)
 ```
 POST /api/export
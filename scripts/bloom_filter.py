@@ -0,0 +1,157 @@
+"""
+Persisted Bloom Filter for Record Hashes
+========================================
+Compact, mmap-backed membership test for the 12-hex-char record_hash values
+used by the seed and generation scripts. Drop-in for the `existing_hashes`
+set: supports `h in bloom` and `bloom.add(h)`.
+
+A 1 MiB filter with 4 probes holds ~850k hashes at ~1% false-positive rate.
+open_domain_bloom() confirms every Bloom hit against the exact hashes in the
+JSONL, so a false positive costs a file scan, never a dropped pair. The filter
+is rebuilt whenever the JSONL's size or mtime no longer matches the ones
+recorded when it was last closed (truncation, restore, another writer).
+
+Usage:
+    from scripts.bloom_filter import open_domain_bloom
+    with open_domain_bloom("preference_data", "halal", load_existing_hashes) as seen:
+        if h not in seen:
+            seen.add(h)
+"""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Iterable
+
+BLOOM_BYTES = 1 << 20  # 1 MiB -> 8,388,608 bits
+BLOOM_PROBES = 4
+
+
+class BloomFilter:
+    """Bloom filter over a bit array stored in a file and mapped into memory.
+
+    With path=None the bit array lives in memory only. Probe positions come
+    from double hashing the two halves of the hex record_hash (already a
+    sha256 prefix), so no extra hashing is needed.
+    """
+
+    def __init__(self, path: Path = None, n_bytes: int = BLOOM_BYTES, n_probes: int = BLOOM_PROBES):
+        self.path = Path(path) if path is not None else None
+        self.n_probes = n_probes
+        self.n_bits = n_bytes * 8
+        self._file = None
+        if self.path is None:
+            self._bits = bytearray(n_bytes)
+            return
+        if not self.path.exists() or self.path.stat().st_size != n_bytes:
+            with open(self.path, "wb") as f:
+                f.truncate(n_bytes)
+        self._file = open(self.path, "r+b")
+        self._bits = mmap.mmap(self._file.fileno(), n_bytes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._file is None:
+            return
+        self._bits.flush()
+        self._bits.close()
+        self._file.close()
+
+    def _positions(self, h: str):
+        half = len(h) // 2
+        h1 = int(h[:half], 16)
+        h2 = int(h[half:], 16) | 1
+        return [(h1 + i * h2) % self.n_bits for i in range(self.n_probes)]
+
+    def __contains__(self, h: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(h))
+
+    def add(self, h: str):
+        bits = self._bits
+        for p in self._positions(h):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def update(self, hashes: Iterable[str]):
+        for h in hashes:
+            self.add(h)
+
+
+def _jsonl_stamp(jsonl_path: Path) -> dict:
+    if not jsonl_path.exists():
+        return {"size": 0, "mtime_ns": 0}
+    st = jsonl_path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class DomainHashes:
+    """Persisted Bloom filter in front of the exact record_hash set of one domain JSONL.
+
+    A Bloom miss is a definite "new"; a hit is confirmed against the exact set,
+    loaded from the JSONL on the first hit only. On close, the JSONL's size and
+    mtime are stamped into a sidecar so the next open can detect a stale filter.
+    Close this after the JSONL writes are flushed, or the next open will rebuild.
+    """
+
+    def __init__(self, bloom: BloomFilter, jsonl_path: Path, stamp_path: Path, load_hashes=None):
+        self.bloom = bloom
+        self.jsonl_path = jsonl_path
+        self.stamp_path = stamp_path
+        self._load_hashes = load_hashes
+        self._exact = None  # loaded lazily on the first Bloom hit
+        self._added = set()  # hashes claimed this session, possibly not yet on disk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.stamp_path.write_text(json.dumps(_jsonl_stamp(self.jsonl_path)))
+        self.bloom.close()
+
+    def __contains__(self, h: str) -> bool:
+        if h not in self.bloom:
+            return False
+        if self._exact is None:
+            self._exact = set()
+            if self._load_hashes and self.jsonl_path.exists():
+                self._exact.update(self._load_hashes(self.jsonl_path))
+            self._exact |= self._added
+        return h in self._exact
+
+    def add(self, h: str):
+        self.bloom.add(h)
+        self._added.add(h)
+        if self._exact is not None:
+            self._exact.add(h)
+
+
+def open_domain_bloom(output_dir, domain: str, load_hashes=None) -> DomainHashes:
+    """Open the {domain}_preferences.bloom filter, rebuilding it if it is missing or stale.
+
+    load_hashes(jsonl_path) -> iterable of record_hash values is used for
+    rebuilds and to confirm Bloom hits exactly.
+    """
+    out_path = Path(output_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    bloom_path = out_path / f"{domain}_preferences.bloom"
+    stamp_path = out_path / f"{domain}_preferences.bloom.json"
+    jsonl_path = out_path / f"{domain}_preferences.jsonl"
+    try:
+        stamp = json.loads(stamp_path.read_text())
+    except (OSError, ValueError):
+        stamp = None
+    rebuild = not bloom_path.exists() or stamp != _jsonl_stamp(jsonl_path)
+    if rebuild and bloom_path.exists():
+        bloom_path.unlink()  # start from an empty bit array
+    bloom = BloomFilter(bloom_path)
+    if rebuild and load_hashes and jsonl_path.exists():
+        bloom.update(load_hashes(jsonl_path))
+    return DomainHashes(bloom, jsonl_path, stamp_path, load_hashes)
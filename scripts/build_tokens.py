@@ -0,0 +1,178 @@
+"""
+Pre-tokenized Preference Cache
+==============================
+Tokenizes every prompt/chosen/rejected string in preference_data/ once and
+writes a CSR-style token cache that DPO/reward-model workers can slice with
+zero per-step tokenization.
+
+Output layout (in --out-dir):
+    tokens.i32.bin   - all token IDs concatenated (int32)
+    offsets.i64.bin  - row pointers, 3 per record (prompt, chosen, rejected) + 1
+    meta.json        - tokenizer name/hash, record and token counts
+
+Usage:
+    python scripts/build_tokens.py --tokenizer unsloth/Qwen2.5-7B-bnb-4bit
+    python scripts/build_tokens.py --domain defense_wm --out-dir ./token_cache
+    python scripts/build_tokens.py --seed-dir scripts/seed_data/halal --out-dir ./token_cache/halal_seed
+
+    # In a training worker:
+    from scripts.build_tokens import TokenizedPreferences
+    ds = TokenizedPreferences("./token_cache")
+    prompt_ids, chosen_ids, rejected_ids = ds[0]
+"""
+
+import json
+import hashlib
+import argparse
+from itertools import chain, islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DATA_DIR = _REPO_ROOT / "preference_data"
+DEFAULT_OUT_DIR = DEFAULT_DATA_DIR / "token_cache"
+
+TOKENS_FILE = "tokens.i32.bin"
+OFFSETS_FILE = "offsets.i64.bin"
+META_FILE = "meta.json"
+FIELDS_PER_RECORD = 3  # prompt, chosen, rejected
+TOKENIZE_BATCH = 64  # records per tokenizer call; fast tokenizers encode a batch in parallel
+
+
+def iter_dpo_triples(data_dir: Path, domain: str = None) -> Iterator[Tuple[str, str, str]]:
+    """Yield (prompt, chosen, rejected) from local JSONL files, skipping ties."""
+    pattern = f"{domain}_preferences.jsonl" if domain else "*_preferences.jsonl"
+    for path in sorted(data_dir.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    r = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                pref = r.get("preference", "")
+                if pref not in ("A", "B"):
+                    continue
+                chosen = r["response_a"] if pref == "A" else r["response_b"]
+                rejected = r["response_b"] if pref == "A" else r["response_a"]
+                yield r["prompt"], chosen, rejected
+
+
+def iter_seed_triples(seed_dir: Path) -> Iterator[Tuple[str, str, str]]:
+    """Yield (prompt, chosen, rejected) from seed shards ({category, prompt, chosen, rejected} per line)."""
+    for path in sorted(Path(seed_dir).glob("*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    r = json.loads(line)
+                    yield r["prompt"], r["chosen"], r["rejected"]
+
+
+def tokenizer_fingerprint(tokenizer) -> str:
+    """Stable hash of the tokenizer vocab, used to invalidate stale caches."""
+    vocab = sorted(tokenizer.get_vocab().items())
+    return hashlib.sha256(json.dumps(vocab).encode()).hexdigest()[:16]
+
+
+def build_token_cache(
+    tokenizer_name: str,
+    data_dir: Path = DEFAULT_DATA_DIR,
+    out_dir: Path = DEFAULT_OUT_DIR,
+    domain: str = None,
+    triples: Iterable[Tuple[str, str, str]] = None,
+) -> dict:
+    """Encode all preference strings once and write tokens/offsets/meta files.
+
+    triples overrides the preference_data/ source, e.g. with iter_seed_triples().
+    """
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    offsets: List[int] = [0]
+    n_records = 0
+    with open(out_dir / TOKENS_FILE, "wb") as tok_f:
+        if triples is None:
+            triples = iter_dpo_triples(data_dir, domain)
+        triples = iter(triples)
+        while batch := list(islice(triples, TOKENIZE_BATCH)):
+            encoded = tokenizer(list(chain.from_iterable(batch)), add_special_tokens=False)["input_ids"]
+            for ids in encoded:
+                tok_f.write(np.asarray(ids, dtype=np.int32).tobytes())
+                offsets.append(offsets[-1] + len(ids))
+            n_records += len(batch)
+
+    np.asarray(offsets, dtype=np.int64).tofile(out_dir / OFFSETS_FILE)
+
+    meta = {
+        "tokenizer": tokenizer_name,
+        "tokenizer_hash": tokenizer_fingerprint(tokenizer),
+        "num_records": n_records,
+        "num_tokens": offsets[-1],
+        "domain": domain,
+        "fields": ["prompt", "chosen", "rejected"],
+    }
+    with open(out_dir / META_FILE, "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+class TokenizedPreferences:
+    """Read-only view over a token cache; rows are zero-copy memmap slices.
+
+    tokens and offsets are both file-backed memmaps, so DataLoader workers
+    share one page-cache copy instead of each holding the arrays on its heap.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_OUT_DIR):
+        cache_dir = Path(cache_dir)
+        with open(cache_dir / META_FILE) as f:
+            self.meta = json.load(f)
+        self.offsets = np.memmap(cache_dir / OFFSETS_FILE, dtype=np.int64, mode="r")
+        if self.offsets[-1] > 0:
+            self.tokens = np.memmap(cache_dir / TOKENS_FILE, dtype=np.int32, mode="r")
+        else:
+            self.tokens = np.empty(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self.meta["num_records"]
+
+    def lengths(self) -> np.ndarray:
+        """(num_records, 3) int32 token counts for prompt/chosen/rejected, for length bucketing.
+
+        e.g. np.argsort(ds.lengths()[:, 1]) orders records by chosen length.
+        """
+        return np.diff(self.offsets).astype(np.int32).reshape(-1, FIELDS_PER_RECORD)
+
+    def __getitem__(self, i: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        base = i * FIELDS_PER_RECORD
+        o = self.offsets
+        return tuple(self.tokens[o[base + k]:o[base + k + 1]] for k in range(FIELDS_PER_RECORD))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-tokenize preference data into a memmap cache")
+    parser.add_argument("--tokenizer", default="unsloth/Qwen2.5-7B-bnb-4bit")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR)
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    parser.add_argument("--domain", default=None, help="Only tokenize one domain")
+    parser.add_argument("--seed-dir", type=Path, default=None, help="Tokenize seed shards (e.g. scripts/seed_data/halal) instead of --data-dir")
+    args = parser.parse_args()
+
+    source = args.seed_dir or args.data_dir
+    triples = iter_seed_triples(args.seed_dir) if args.seed_dir else None
+    print(f"Tokenizing {source} with {args.tokenizer}...")
+    meta = build_token_cache(args.tokenizer, args.data_dir, args.out_dir, args.domain, triples)
+    print(f"[OK] {meta['num_records']} records, {meta['num_tokens']} tokens -> {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
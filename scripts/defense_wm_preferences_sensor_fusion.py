@@ -15,27 +15,45 @@ SENSOR_FUSION_PREFS = [
 ```python
 def train_3dgs_with_lidar(images, colmap_output, lidar_points, lidar_to_camera):
     gaussians = init_gaussians(colmap_output)
-    lidar_depth_maps = {cam_id: project_lidar_to_depth(lidar_points, cam, lidar_to_camera)
-                        for cam_id, cam in colmap_output.cameras.items()}
-    
+    # Per camera, once: (valid pixel indices, LiDAR depths) resident on GPU
+    lidar_targets = {}
+    for cam_id, cam in colmap_output.cameras.items():
+        depth = project_lidar_to_depth(lidar_points, cam, lidar_to_camera).flatten()
+        valid_idx = torch.nonzero(depth > 0).squeeze(1)
+        lidar_targets[cam_id] = (valid_idx, depth[valid_idx])
+
+    # Fixed (H, W) for the whole run: specialize once, replay as CUDA graphs
+    render_fixed = torch.compile(render, mode='reduce-overhead', dynamic=False)
+
     for iteration in range(30000):
         cam_id = sample_camera()
-        rendered_rgb, rendered_depth = render(gaussians, cameras[cam_id])
+        rendered_rgb, rendered_depth = render_fixed(gaussians, cameras[cam_id])
         rgb_loss = l1_loss(rendered_rgb, images[cam_id])
-        valid = lidar_depth_maps[cam_id] > 0
-        depth_loss = l1_loss(rendered_depth[valid], lidar_depth_maps[cam_id][valid])
+        valid_idx, gt_depth = lidar_targets[cam_id]
+        depth_loss = (rendered_depth.flatten()[valid_idx] - gt_depth).abs().mean()
         loss = rgb_loss + 0.1 * depth_loss
+
+def project_lidar_to_depth(lidar_points, cam, lidar_to_camera):
+    # GPU z-buffer: one scatter with min-reduce, no depth sort
+    pts = lidar_points @ lidar_to_camera[:3, :3].T + lidar_to_camera[:3, 3]
+    uvw = pts @ cam.K.T
+    u = (uvw[:, 0] / uvw[:, 2]).long()
+    v = (uvw[:, 1] / uvw[:, 2]).long()
+    valid = (u >= 0) & (u < cam.W) & (v >= 0) & (v < cam.H) & (pts[:, 2] > 0)
+    depth = torch.full((cam.H * cam.W,), float('inf'), device=pts.device)
+    depth.scatter_reduce_(0, v[valid] * cam.W + u[valid], pts[valid, 2], reduce='amin')
+    return depth.nan_to_num_(posinf=0.0).view(cam.H, cam.W)  # 0 = no return
 ```
 
 **Method 2: LiDAR as initialization**
 ```python
 def init_gaussians_from_lidar(lidar_points, lidar_colors=None):
-    nn = NearestNeighbors(n_neighbors=5).fit(lidar_points)
-    distances, _ = nn.kneighbors(lidar_points)
-    scales = distances[:, 1:].mean(axis=1) / 2
+    tree = cKDTree(lidar_points, leafsize=32, balanced_tree=False)
+    distances, _ = tree.query(lidar_points, k=5, workers=-1)  # all cores
+    scales = distances[:, 1:].mean(axis=1) * 0.5
     gaussians = GaussianModel()
-    gaussians.means = torch.tensor(lidar_points)
-    gaussians.scales = torch.tensor(scales).unsqueeze(1).repeat(1, 3)
+    gaussians.means = torch.from_numpy(lidar_points)
+    gaussians.scales = torch.from_numpy(scales).unsqueeze(1).expand(-1, 3).contiguous()
     return gaussians
 ```
 
@@ -68,14 +86,16 @@ def dual_band_reconstruction(visible_images, thermal_images, calibration):
 **Method 2: Multi-spectral training**
 ```python
 class MultiSpectralGaussian(nn.Module):
-    rgb_sh = nn.Parameter(torch.zeros(n_points, 48))
-    thermal = nn.Parameter(torch.zeros(n_points, 1))
+    rgb_sh = nn.Parameter(torch.zeros(n_points, 48, dtype=torch.bfloat16))  # dominant fetch: half the bytes
+    thermal = nn.Parameter(torch.zeros(n_points, 1))  # means/scales/thermal stay FP32
 
 def train_multispectral(gaussians, visible_images, thermal_images, cameras):
     for iteration in range(30000):
-        rendered_rgb = render_rgb(gaussians, cameras[cam])
-        rendered_thermal = render_thermal(gaussians, cameras[cam])
-        loss = l1_loss(rendered_rgb, visible_images[cam]) + 0.3 * l1_loss(rendered_thermal, thermal_images[cam])
+        with torch.autocast('cuda', dtype=torch.bfloat16):
+            rendered_rgb = render_rgb(gaussians, cameras[cam])
+            rendered_thermal = render_thermal(gaussians, cameras[cam])
+        # Loss accumulated in FP32
+        loss = l1_loss(rendered_rgb.float(), visible_images[cam]) + 0.3 * l1_loss(rendered_thermal.float(), thermal_images[cam])
 ```
 
 **Visualization:**
@@ -106,11 +126,20 @@ def render_multiband(gaussians, camera, mode='fusion'):
 
 **Feature-based:**
 ```python
-def register_images_features(source, target, method='sift'):
-    detector = cv2.SIFT_create()
-    kp1, desc1 = detector.detectAndCompute(source, None)
-    kp2, desc2 = detector.detectAndCompute(target, None)
-    matches = cv2.BFMatcher(cv2.NORM_L2).knnMatch(desc1, desc2, k=2)
+detector = cv2.SIFT_create()
+matcher = cv2.FlannBasedMatcher(dict(algorithm=1, trees=5), dict(checks=50))  # KD-forest
+_desc_cache = {}
+
+def _features(img, key):
+    # Reuse descriptors across calls, e.g. a fixed target in a rig sweep (key = image path)
+    if key not in _desc_cache:
+        _desc_cache[key] = detector.detectAndCompute(img, None)
+    return _desc_cache[key]
+
+def register_images_features(source, target, source_key, target_key):
+    kp1, desc1 = _features(source, source_key)
+    kp2, desc2 = _features(target, target_key)
+    matches = matcher.knnMatch(desc1, desc2, k=2)
     good = [m for m, n in matches if m.distance < 0.75 * n.distance]
     H, _ = cv2.findHomography(src_pts, dst_pts, cv2.RANSAC, 5.0)
     return cv2.warpPerspective(source, H, target.shape[:2][::-1])
@@ -118,13 +147,42 @@ def register_images_features(source, target, method='sift'):
 
 **Intensity-based (multi-modal):**
 ```python
-def mutual_information(params, source, target):
+def mutual_information(params, source, target, bins=64):
     transformed = apply_transform(source, params)
-    hist_2d = np.histogram2d(target.ravel(), transformed.ravel(), bins=64)[0]
-    # Compute MI from joint histogram
+    # Joint histogram via bincount on quantized intensities (no sort, unlike histogram2d)
+    a = (target.ravel() * (bins - 1) / target.max()).astype(np.int32)
+    b = (transformed.ravel() * (bins - 1) / transformed.max()).astype(np.int32)
+    p_ab = np.bincount(a * bins + b, minlength=bins * bins).reshape(bins, bins) / a.size
+    p_a, p_b = p_ab.sum(1), p_ab.sum(0)
+    nz = p_ab > 0
+    mi = (p_ab[nz] * np.log2(p_ab[nz] / np.outer(p_a, p_b)[nz])).sum()
     return -mi  # Minimize negative MI
 ```
 
+**GPU translation sweep (cuFFT via CuPy):**
+```python
+def register_translation_gpu(source, target, bins=64, top_k=8):
+    src, tgt = cp.asarray(source, cp.float32), cp.asarray(target, cp.float32)
+    # All integer shifts scored at once: IFFT of the conjugate cross-power spectrum
+    F_src, F_tgt = cp.fft.rfft2(src), cp.fft.rfft2(tgt)
+    scores = cp.fft.irfft2(F_tgt * cp.conj(F_src), s=src.shape)
+    candidates = cp.argsort(scores.ravel())[-top_k:]
+    # Refine the best candidates by MI, joint histogram built on-device
+    q_tgt = (tgt * (bins - 1) / tgt.max()).astype(cp.int32).ravel()
+    best_shift, best_mi = None, -cp.inf
+    for flat in candidates.get():
+        shift = np.unravel_index(flat, src.shape)
+        moved = cp.roll(src, shift, axis=(0, 1))
+        q_src = (moved * (bins - 1) / moved.max()).astype(cp.int32).ravel()
+        p_ab = cp.bincount(q_tgt * bins + q_src, minlength=bins * bins).reshape(bins, bins) / q_tgt.size
+        nz = p_ab > 0
+        mi = (p_ab[nz] * cp.log2(p_ab[nz] / cp.outer(p_ab.sum(1), p_ab.sum(0))[nz])).sum()
+        if mi > best_mi:
+            best_shift, best_mi = shift, mi
+    return best_shift, float(best_mi)
+```
+For rotations, batch-rotate the source on GPU (`torchvision.transforms.functional.rotate`) and run the same sweep per angle.
+
 **Sensor pairing recommendations:**
 
 | Pair | Best Approach |
@@ -150,10 +208,15 @@ def mutual_information(params, source, target):
 class LooseCoupledFusion:
     def __init__(self):
         self.kf = KalmanFilter(dim_x=9, dim_z=6)  # [x,y,z,vx,vy,vz,r,p,y]
-        
+        # Reused every GPS update (10 Hz): no per-call allocations
+        self._R_gps = np.diag([0.0, 0.0, 0.0, 1e6, 1e6, 1e6])
+        self._z_gps = np.zeros(6)
+
     def update_gps(self, gps_position, gps_covariance):
-        self.kf.R = np.diag([*np.diag(gps_covariance), 1e6, 1e6, 1e6])
-        self.kf.update(np.array([*gps_position, 0, 0, 0]))
+        self._R_gps[[0, 1, 2], [0, 1, 2]] = np.diag(gps_covariance)
+        self._z_gps[:3] = gps_position
+        self.kf.R = self._R_gps
+        self.kf.update(self._z_gps)
         
     def update_visual(self, visual_pose, visual_covariance):
         self.kf.R = visual_covariance
@@ -192,7 +255,9 @@ class TemporalSynchronizer:
     def estimate_offset(self, sensor1, sensor2, method='correlation'):
         signal1 = self.extract_motion_signal(sensor1)
         signal2 = self.extract_motion_signal(sensor2)
-        correlation = np.correlate(signal1, signal2, mode='full')
+        # FFT path: O(N log N) instead of np.correlate's direct O(N^2)
+        correlation = scipy.signal.correlate(signal1 - signal1.mean(), signal2 - signal2.mean(),
+                                             mode='full', method='fft')
         lag = np.argmax(correlation) - len(signal1) + 1
         return lag * dt
     
@@ -208,18 +273,45 @@ def resample_to_common_rate(streams, target_rate=30):
     t_min = max(s['timestamps'][0] for s in streams.values())
     t_max = min(s['timestamps'][-1] for s in streams.values())
     common_times = np.linspace(t_min, t_max, int((t_max - t_min) * target_rate))
-    return {name: interp1d(s['timestamps'], s['data'])(common_times) for name, s in streams.items()}
+
+    def resample(s):
+        if s['data'].ndim == 1:
+            return np.interp(common_times, s['timestamps'], s['data'])
+        # Timestamps are already sorted: skip interp1d's sort and copy
+        return interp1d(s['timestamps'], s['data'], axis=0, assume_sorted=True, copy=False)(common_times)
+
+    return {name: resample(s) for name, s in streams.items()}
+```
+
+**Online (30 Hz loop) variant - buffers allocated once, reused each tick:**
+```python
+class Resampler:
+    def __init__(self, streams, target_rate=30, window=1.0):
+        self._offsets = np.arange(int(window * target_rate)) / target_rate
+        self.common_times = np.empty_like(self._offsets)
+        self.out = {name: np.empty((len(self._offsets), *s['data'].shape[1:])) for name, s in streams.items()}
+
+    def step(self, streams, t_start):
+        np.add(self._offsets, t_start, out=self.common_times)
+        for name, s in streams.items():
+            out, data = self.out[name], s['data']
+            if data.ndim == 1:
+                np.copyto(out, np.interp(self.common_times, s['timestamps'], data))
+            else:
+                for c in range(data.shape[1]):
+                    out[:, c] = np.interp(self.common_times, s['timestamps'], data[:, c])
+        return self.out  # views are overwritten on the next step()
 ```
 
 **Frame association:**
 ```python
 def associate_frames(camera_times, lidar_times, max_offset=0.05):
-    associations = []
-    for i, cam_t in enumerate(camera_times):
-        nearest = np.argmin(np.abs(lidar_times - cam_t))
-        if abs(lidar_times[nearest] - cam_t) < max_offset:
-            associations.append({'camera': i, 'lidar': nearest})
-    return associations
+    # lidar_times is sorted: one binary search per frame instead of a full scan
+    idx = np.clip(np.searchsorted(lidar_times, camera_times), 1, len(lidar_times) - 1)
+    pick_left = (camera_times - lidar_times[idx - 1]) < (lidar_times[idx] - camera_times)
+    nearest = np.where(pick_left, idx - 1, idx)
+    mask = np.abs(lidar_times[nearest] - camera_times) < max_offset
+    return np.stack([np.nonzero(mask)[0], nearest[mask]], axis=1)  # rows: (camera, lidar)
 ```""",
         "rejected": "Estimate time offsets between sensors using cross-correlation of motion signals, then interpolate all data to common timestamps."
     },
@@ -279,14 +371,22 @@ def late_fusion_3dgs(rgb_images, lidar_points):
 def calibrate_intrinsics(images, pattern_size=(9, 6), square_size=0.025):
     objp = np.zeros((pattern_size[0] * pattern_size[1], 3), np.float32)
     objp[:, :2] = np.mgrid[0:pattern_size[0], 0:pattern_size[1]].T.reshape(-1, 2) * square_size
-    
-    for img in images:
-        ret, corners = cv2.findChessboardCorners(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), pattern_size)
-        if ret:
-            obj_points.append(objp)
-            img_points.append(cv2.cornerSubPix(gray, corners, (11,11), (-1,-1), criteria))
-    
-    ret, K, dist, rvecs, tvecs = cv2.calibrateCamera(obj_points, img_points, gray.shape[::-1], None, None)
+
+    def detect(img):
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # Saddle-point detector refines to subpixel internally: no cornerSubPix pass
+        ok, corners = cv2.findChessboardCornersSB(gray, pattern_size, cv2.CALIB_CB_EXHAUSTIVE | cv2.CALIB_CB_ACCURACY)
+        return ok, corners
+
+    # OpenCV releases the GIL, so threads detect in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        img_points = [c for ok, c in pool.map(detect, images) if ok]
+    if not img_points:
+        raise ValueError(f"No {pattern_size} checkerboard found in any of {len(images)} images")
+    obj_points = [objp] * len(img_points)
+    image_size = images[0].shape[1::-1]  # (width, height)
+
+    ret, K, dist, rvecs, tvecs = cv2.calibrateCamera(obj_points, img_points, image_size, None, None)
     return {'K': K, 'distortion': dist, 'error': ret}
 ```
 
@@ -314,18 +414,34 @@ ret, K_l, d_l, K_r, d_r, R, T, E, F = cv2.stereoCalibrate(
 **Method 1: Depth initialization**
 ```python
 def init_gaussians_from_rgbd(rgb, depth, K, max_depth=10.0):
-    u, v = np.meshgrid(np.arange(depth.shape[1]), np.arange(depth.shape[0]))
-    valid = (depth > 0) & (depth < max_depth)
-    
-    z = depth[valid]
-    x = (u[valid] - K[0,2]) * z / K[0,0]
-    y = (v[valid] - K[1,2]) * z / K[1,1]
-    
-    points = np.stack([x, y, z], axis=-1)
-    colors = rgb[valid] / 255.0
+    H, W = depth.shape
+    depth_f = depth.ravel()
+    valid = (depth_f > 0) & (depth_f < max_depth)
+    z = depth_f[valid].astype(np.float32)
+
+    # Flat pixel grid, filtered once; (u - cx) * z * fx_inv done in place
+    vu = np.mgrid[0:H, 0:W].reshape(2, -1)[:, valid].astype(np.float32)
+    x = np.multiply(vu[1] - K[0,2], z, out=vu[1]); x *= 1.0 / K[0,0]
+    y = np.multiply(vu[0] - K[1,2], z, out=vu[0]); y *= 1.0 / K[1,1]
+
+    points = np.column_stack([x, y, z])
+    colors = rgb.reshape(-1, 3)[valid] / 255.0
     return init_gaussians(points, colors)
 ```
 
+**Method 1b: GPU back-projection (Open3D tensor API, no host round-trip)**
+```python
+def init_gaussians_from_rgbd_cuda(depth, K, depth_scale=1000.0, max_depth=10.0):
+    device = o3d.core.Device("CUDA:0")
+    depth_img = o3d.t.geometry.Image(o3d.core.Tensor(depth, o3d.core.Dtype.UInt16, device=device))
+    intrinsic = o3d.core.Tensor(K, o3d.core.Dtype.Float64)
+    pcd = o3d.t.geometry.PointCloud.create_from_depth_image(
+        depth_img, intrinsic, depth_scale=depth_scale, depth_max=max_depth)
+    # Zero-copy hand-off of the device tensor to PyTorch
+    points = torch.utils.dlpack.from_dlpack(pcd.point.positions.to_dlpack())
+    return init_gaussians(points)
+```
+
 **Method 2: Depth supervision**
 ```python
 def train_3dgs_with_depth(images, depth_maps, colmap_output, depth_weight=0.1):
@@ -361,24 +477,76 @@ def train_3dgs_visibility_aware(gaussians, images, cameras):
     for iteration in range(30000):
         rendered_rgb, alpha, visibility_map = render_with_visibility(gaussians, cameras[cam])
         loss_weight = visibility_map * alpha
-        rgb_loss = (torch.abs(rendered_rgb - gt_rgb) * loss_weight).sum() / (loss_weight.sum() + 1e-6)
+        rgb_loss = weighted_l1(rendered_rgb, gt_rgb, loss_weight)  # [H, W, 3], [H, W, 3], [H, W]
+
+@triton.jit
+def _weighted_l1_kernel(pred_ptr, gt_ptr, w_ptr, num_ptr, N, C, BLOCK: tl.constexpr):
+    offs = tl.program_id(0) * BLOCK + tl.arange(0, BLOCK)
+    mask = offs < N
+    err = tl.load(pred_ptr + offs, mask=mask, other=0.0) - tl.load(gt_ptr + offs, mask=mask, other=0.0)
+    # One weight per pixel, shared by its C channels: no expanded H x W x 3 weight
+    w = tl.load(w_ptr + offs // C, mask=mask, other=0.0)
+    tl.atomic_add(num_ptr, tl.sum(tl.abs(err) * w, axis=0))
+
+# sum(|pred - gt| * w) / sum(w) with w per pixel: fused forward, PyTorch backward
+class WeightedL1(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, pred, gt, w, BLOCK=4096):
+        pred, gt = pred.contiguous(), gt.contiguous()
+        w_pix = w.reshape(pred.shape[:-1]).contiguous()
+        num = torch.zeros(1, device=pred.device, dtype=torch.float32)
+        grid = (triton.cdiv(pred.numel(), BLOCK),)
+        _weighted_l1_kernel[grid](pred, gt, w_pix, num, pred.numel(), pred.shape[-1], BLOCK=BLOCK)
+        den = w_pix.sum() + 1e-6  # over H x W, as in the plain PyTorch loss
+        loss = num[0] / den
+        ctx.save_for_backward(pred, gt, w_pix, den, loss)
+        ctx.w_shape = w.shape
+        return loss
+
+    @staticmethod
+    def backward(ctx, grad):
+        pred, gt, w_pix, den, loss = ctx.saved_tensors
+        err = pred - gt
+        grad_pred = grad * torch.sign(err) * (w_pix / den)[..., None]
+        # d/dw_p of num / den: (sum_c |err_pc| - loss) / den; alpha gets gradients too
+        grad_w = grad * (err.abs().sum(-1) - loss) / den
+        return grad_pred, None, grad_w.reshape(ctx.w_shape), None
+
+weighted_l1 = WeightedL1.apply
 ```
 
 **Method 2: Multi-view consistency**
 ```python
 def enforce_multiview_consistency(gaussians, images, cameras, n_views=3):
     cam_indices = sample_overlapping_cameras(cameras, n_views)
-    losses = [l1_loss(render(gaussians, cameras[i]), images[i]) for i in cam_indices]
-    consistency_loss = torch.std(torch.stack(losses))
-    total_loss = sum(losses) + 0.1 * consistency_loss
+    # One pass over the Gaussians for all views -> [n_views, H, W, 3]
+    rgbs = render_batch(gaussians, [cameras[i] for i in cam_indices])
+    losses = (rgbs - images[cam_indices]).abs().mean(dim=(1, 2, 3))
+    total_loss = losses.sum() + 0.1 * losses.std()
 ```
 
 **Method 3: Occlusion-aware densification**
 ```python
 def densify_occluded_regions(gaussians, images, cameras):
-    visibility_count = compute_per_pixel_visibility(gaussians, cameras)
-    poorly_visible = visibility_count.sum(dim=0) < (len(cameras) * 0.3)
+    P = np.stack([cam.K @ cam.world_to_cam[:3] for cam in cameras])  # [C, 3, 4]
+    visibility_count = compute_per_pixel_visibility(gaussians.means.numpy(), P, W, H)
+    poorly_visible = visibility_count < (len(cameras) * 0.3)
     # Add Gaussians in poorly visible regions
+
+@njit(parallel=True, fastmath=True, cache=True)
+def compute_per_pixel_visibility(means, P, W, H):
+    counts = np.zeros(means.shape[0], np.int32)
+    for g in prange(means.shape[0]):  # parallel over Gaussians: no write races
+        x, y, z = means[g]
+        for c in range(P.shape[0]):
+            pz = P[c, 2, 0] * x + P[c, 2, 1] * y + P[c, 2, 2] * z + P[c, 2, 3]
+            if pz <= 0:
+                continue
+            u = (P[c, 0, 0] * x + P[c, 0, 1] * y + P[c, 0, 2] * z + P[c, 0, 3]) / pz
+            v = (P[c, 1, 0] * x + P[c, 1, 1] * y + P[c, 1, 2] * z + P[c, 1, 3]) / pz
+            if 0 <= u < W and 0 <= v < H:
+                counts[g] += 1
+    return counts
 ```
 
 **Method 4: Depth-based reasoning** - Compare rendered depth to GT depth to identify occluded Gaussians
@@ -410,17 +578,29 @@ def align_and_merge_reconstructions(gs_list):
 **Method 2: Overlap-aware blending**
 ```python
 def merge_gaussians_dedupe(gs1, gs2, threshold=0.05, mode='weighted'):
-    tree = KDTree(gs1.means.numpy())
-    distances, indices = tree.query(gs2.means.numpy())
-    overlapping = distances < threshold
+    # Only the KD-tree runs on the CPU; the merge itself stays in torch
+    tree = cKDTree(gs1.means.detach().cpu().numpy(), balanced_tree=False, compact_nodes=False)
+    # k=1 only; distance_upper_bound prunes branches beyond the merge radius
+    distances, indices = tree.query(gs2.means.detach().cpu().numpy(), k=1,
+                                    distance_upper_bound=threshold, workers=-1)
+    device = gs1.means.device
+    overlapping = torch.from_numpy(distances < threshold).to(device)
     
+    merged = copy_gaussians(gs1)
+
     if mode == 'weighted':
-        for i, (dist, idx) in enumerate(zip(distances, indices)):
-            if dist < threshold:
-                w1, w2 = gs1.opacities[idx], gs2.opacities[i]
-                merged.means[idx] = (w1 * gs1.means[idx] + w2 * gs2.means[i]) / (w1 + w2)
+        with torch.no_grad():
+            idx = torch.from_numpy(indices).to(device)[overlapping]
+            w2 = gs2.opacities[overlapping]
+            # Opacity-weighted average, scatter-added since several gs2 points can hit one gs1 Gaussian
+            num = gs1.opacities[:, None] * gs1.means
+            wsum = gs1.opacities.clone()
+            num.index_add_(0, idx, w2[:, None] * gs2.means[overlapping])
+            wsum.index_add_(0, idx, w2)
+            merged.means[idx] = num[idx] / wsum[idx, None]
     # Add non-overlapping from gs2
     add_gaussians(merged, gs2, mask=~overlapping)
+    return merged
 ```
 
 **Method 3: Joint optimization** on all source data after merge
@@ -452,6 +632,22 @@ class IMUPreintegrator:
         self.delta_v += self.delta_R @ accel * dt
         # Integrate position
         self.delta_p += self.delta_v * dt + 0.5 * self.delta_R @ accel * dt**2
+
+    def integrate_window(self, gyros, accels, dt):
+        # Batched Rodrigues for all K samples at once (gyros, accels: [K, 3])
+        omega = gyros * dt
+        theta = np.linalg.norm(omega, axis=1)[:, None, None]
+        Kx = hat(omega)  # [K, 3, 3]
+        small = theta < 1e-8
+        a = np.where(small, 1.0, np.sin(theta) / np.where(small, 1.0, theta))
+        b = np.where(small, 0.5, (1 - np.cos(theta)) / np.where(small, 1.0, theta) ** 2)
+        R_inc = np.eye(3) + a * Kx + b * (Kx @ Kx)
+        # Running products of 3x3 matrices; everything else is vectorized
+        Rs = np.stack(list(accumulate(R_inc, np.matmul, initial=self.delta_R))[1:])
+        dv = np.einsum('kij,kj->ki', Rs, accels) * dt
+        vs = self.delta_v + np.cumsum(dv, axis=0)
+        self.delta_p += vs.sum(axis=0) * dt + 0.5 * dv.sum(axis=0) * dt
+        self.delta_v, self.delta_R = vs[-1], Rs[-1]
 ```
 
 **COLMAP with IMU priors:**
@@ -498,20 +694,21 @@ Master Frame (typically main camera or vehicle body):
 class MultiSensorRig:
     def __init__(self):
         self.transforms = {}  # sensor_name -> 4x4 matrix
-        
+        self._Rt = {}         # sensor_name -> (R.T, t), precomputed for point transforms
+
     def add_sensor(self, name, R, t):
         T = np.eye(4)
         T[:3, :3] = R
         T[:3, 3] = t
         self.transforms[name] = T
-    
+        self._Rt[name] = (np.ascontiguousarray(R.T), np.asarray(t))
+
     def sensor_to_master(self, sensor_name, points):
-        T = self.transforms[sensor_name]
-        points_h = np.hstack([points, np.ones((len(points), 1))])
-        return (T @ points_h.T).T[:, :3]
-    
+        R_T, t = self._Rt[sensor_name]
+        return points @ R_T + t  # no homogeneous N x 4 copy
+
     def master_to_world(self, master_pose, points):
-        return (master_pose @ np.hstack([points, np.ones((len(points), 1))]).T).T[:, :3]
+        return points @ master_pose[:3, :3].T + master_pose[:3, 3]
 ```
 
 **Calibration workflow:**
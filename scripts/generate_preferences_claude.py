@@ -16,10 +16,15 @@ Usage:
 import os
 import sys
 import json
+import sqlite3
+import random
 import asyncio
 import argparse
 from pathlib import Path
 from typing import List, Dict, Optional
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 import hashlib
 
@@ -35,13 +40,26 @@ except ImportError:
     HAS_ANTHROPIC = False
     print("[WARNING] anthropic not installed. Run: pip install anthropic")
 
-from scripts.zuup_sdk import ZuupPreferenceClient
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from scripts.zuup_sdk import AsyncZuupPreferenceClient
+from scripts.bloom_filter import open_domain_bloom
 from domains.taxonomy import DOMAINS, get_domain
 
 # Configuration
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 ZUUP_API_KEY = os.getenv("ZUUP_API_KEY", "")
 MODEL = "claude-sonnet-4-20250514"
+BASELINE_MODEL = "claude-3-5-haiku-20241022"  # suggested --response-b-model
+BASELINE_SYSTEM = "You are a generic assistant. Answer the question briefly in general terms."
+BASELINE_MAX_TOKENS = 1024
+DEFAULT_MAX_CONCURRENCY = 10  # in-flight requests; keeps a Tier 2 key under its RPM limit
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
 
 # Domain-specific generation prompts
 DOMAIN_PROMPTS = {
@@ -133,9 +151,10 @@ Generate realistic questions that edge or tactical IT engineers would ask.""",
 Generate realistic questions that SBA or small business contracting specialists would ask.""",
 }
 
-GENERATION_TEMPLATE = """Generate a preference pair for training an AI assistant on {domain} topics.
+# Invariant instructions: sent in the cached system block, not per request
+GENERATION_INSTRUCTIONS = """Generate preference pairs for training an AI assistant on {domain} topics.
 
-REQUIREMENTS:
+REQUIREMENTS (for each pair):
 1. Create a realistic question that a professional would ask
 2. Generate TWO responses:
    - Response A: Expert-quality, detailed, accurate, actionable
@@ -143,29 +162,201 @@ REQUIREMENTS:
 3. Response A should CLEARLY be better than Response B
 4. Include specific domain terminology and real-world applicability
 
-CATEGORY: {category}
-CATEGORY DESCRIPTION: {category_desc}
+OUTPUT FORMAT (JSON), one entry per requested category, in order:
+{{
+    "pairs": [
+        {{
+            "prompt": "The professional's question",
+            "response_a": "The expert, comprehensive response",
+            "response_b": "The mediocre, generic response",
+            "category": "The category id given in the request",
+            "reasoning": "Brief explanation of why A is better"
+        }}
+    ]
+}}
+
+Respond with ONLY the JSON object, no prose, no markdown fences."""
 
-OUTPUT FORMAT (JSON):
+# Variant used when Response B comes from a separate, smaller model
+EXPERT_ONLY_INSTRUCTIONS = """Generate questions and expert answers for training an AI assistant on {domain} topics.
+
+REQUIREMENTS (for each entry):
+1. Create a realistic question that a professional would ask
+2. Write an expert-quality response: detailed, accurate, actionable
+3. Include specific domain terminology and real-world applicability
+
+OUTPUT FORMAT (JSON), one entry per requested category, in order:
 {{
-    "prompt": "The professional's question",
-    "response_a": "The expert, comprehensive response",
-    "response_b": "The mediocre, generic response",
-    "category": "{category}",
-    "reasoning": "Brief explanation of why A is better"
+    "pairs": [
+        {{
+            "prompt": "The professional's question",
+            "response_a": "The expert, comprehensive response",
+            "category": "The category id given in the request"
+        }}
+    ]
 }}
 
-Generate ONE preference pair now:"""
+Respond with ONLY the JSON object, no prose, no markdown fences."""
+
+# Per-request tail: only the categories vary between calls
+GENERATION_TEMPLATE = """CATEGORIES:
+{category_lines}
+
+Generate {n_pairs} preference pair(s) now, one per category above:"""
+
+# Optional per-request head: earlier generations used as few-shot seeds
+EXAMPLES_TEMPLATE = """EARLIER PAIRS for these categories. Use them as style references only;
+write new, different questions and do not repeat them:
+{examples}
+
+"""
+
+MAX_TOKENS_PER_PAIR = 2000
+DEFAULT_PAIRS_PER_CALL = 5
+MAX_LIVE_PAIRS_PER_CALL = 10  # keeps max_tokens under the SDK's non-streaming limit (~21k)
+BATCH_POLL_SECONDS = 30
+DEDUP_RETRIES = 2  # regeneration attempts for pairs that duplicate existing records
+JSONL_FLUSH_EVERY = 64  # records per writelines + fsync
+GEN_CACHE_FILE = ".gen_cache.sqlite"
+
+
+@dataclass(frozen=True)
+class DomainContext:
+    """Per-domain generation state, resolved once per batch instead of per call."""
+    domain: str
+    categories: tuple  # (category_id, description) pairs
+    descriptions: Dict[str, str]
+    system: List[Dict]
+    expert_only: bool = False  # system prompt asks for Response A only
+
+
+def build_system_blocks(domain: str, expert_only: bool = False) -> List[Dict]:
+    """System prompt as a single prompt-cached block (expert bio + generation instructions)."""
+    instructions = EXPERT_ONLY_INSTRUCTIONS if expert_only else GENERATION_INSTRUCTIONS
+    text = DOMAIN_PROMPTS.get(domain, f"You are an expert in {domain}.")
+    text += "\n\n" + instructions.format(domain=domain)
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+class GenerationCache:
+    """SQLite store of past generations, keyed by (domain, category, prompt version).
+
+    Changing the domain prompt, instructions or template changes the key, so
+    stale generations are never reused.
+    """
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS generations ("
+            "record_hash TEXT PRIMARY KEY, key TEXT NOT NULL, response TEXT NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS generations_key ON generations (key)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.conn.commit()
+        self.conn.close()
+
+    @staticmethod
+    def key(ctx: "DomainContext", category: str) -> str:
+        content = f"{ctx.domain}|{category}|{ctx.system[0]['text']}|{GENERATION_TEMPLATE}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def put(self, ctx: "DomainContext", pairs: List[Dict]):
+        """Store accepted pairs so later runs can seed from them."""
+        rows = [
+            (record_hash(p), self.key(ctx, p["category"]), json.dumps(
+                {k: p[k] for k in ("prompt", "response_a", "response_b")}
+            ))
+            for p in pairs
+        ]
+        self.conn.executemany("INSERT OR IGNORE INTO generations VALUES (?, ?, ?)", rows)
+        self.conn.commit()
+
+    def sample(self, ctx: "DomainContext", category: str) -> Optional[Dict]:
+        """A random cached generation for this key, or None on a miss."""
+        row = self.conn.execute(
+            "SELECT response FROM generations WHERE key = ? ORDER BY RANDOM() LIMIT 1",
+            (self.key(ctx, category),),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+@lru_cache(maxsize=None)
+def _cached_domain(domain_id: str):
+    return get_domain(domain_id)
+
+
+@lru_cache(maxsize=None)
+def build_domain_context(domain_id: str, expert_only: bool = False) -> DomainContext:
+    """Look up the domain once and pre-build its category table and system blocks.
+
+    Cached, so callers that don't pass a ctx still reuse one context per domain.
+    """
+    domain_obj = _cached_domain(domain_id)
+    if domain_obj and domain_obj.categories:
+        categories = tuple((c.id, c.description) for c in domain_obj.categories)
+    else:
+        categories = (("general", "General domain questions"),)
+    return DomainContext(
+        domain=domain_id,
+        categories=categories,
+        descriptions=dict(categories),
+        system=build_system_blocks(domain_id, expert_only),
+        expert_only=expert_only,
+    )
+
+
+def json_loads(data):
+    """Parse JSON with orjson when available."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def json_dumps_line(record: Dict) -> bytes:
+    """Serialize one JSONL line to bytes with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def record_hash(pref: Dict) -> str:
+    """Dedup hash over prompt + both responses (same as the seed scripts)."""
+    content = f"{pref['prompt']}{pref['response_a']}{pref['response_b']}"
+    return hashlib.sha256(content.encode()).hexdigest()[:12]
 
 
-def get_category_for_domain(domain_id: str) -> tuple:
-    """Get a random category from domain."""
-    import random
-    domain = get_domain(domain_id)
-    if not domain:
-        return "general", "General domain questions"
-    cat = random.choice(domain.categories)
-    return cat.id, cat.description
+def load_existing_hashes(jsonl_path: Path) -> set:
+    """Collect record_hash values already present in a domain JSONL file."""
+    hashes = set()
+    if not jsonl_path.exists():
+        return hashes
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                rec = json.loads(line.strip())
+                if rec.get("record_hash"):
+                    hashes.add(rec["record_hash"])
+            except Exception:
+                pass
+    return hashes
+
+
+def drop_duplicates(pairs: List[Dict], existing_hashes: Optional[set]) -> List[Dict]:
+    """Filter pairs already seen, claiming the hashes of the ones kept."""
+    if existing_hashes is None:
+        return pairs
+    fresh = []
+    for pair in pairs:
+        h = record_hash(pair)
+        if h in existing_hashes:
+            print(f"  [SKIP] Duplicate: {pair['prompt'][:40]}...")
+            continue
+        existing_hashes.add(h)
+        fresh.append(pair)
+    return fresh
 
 
 def preference_to_jsonl_record(pref: Dict, index: int) -> Dict:
@@ -186,78 +377,239 @@ def preference_to_jsonl_record(pref: Dict, index: int) -> Dict:
             "generated_at": datetime.now(timezone.utc).isoformat(),
         },
     }
-    content = f"{record['prompt']}{record['response_a']}{record['response_b']}"
-    record["record_hash"] = hashlib.sha256(content.encode()).hexdigest()[:12]
+    if pref.get("response_b_model"):
+        record["metadata"]["response_b_model"] = pref["response_b_model"]
+    record["record_hash"] = record_hash(record)
     return record
 
 
-async def generate_preference_claude(
-    client: anthropic.Anthropic,
-    domain: str,
-    category: str = None,
-) -> Optional[Dict]:
-    """Generate a single preference pair using Claude."""
-    
-    if category is None:
-        category, cat_desc = get_category_for_domain(domain)
-    else:
-        domain_obj = get_domain(domain)
-        cat_desc = next(
-            (c.description for c in domain_obj.categories if c.id == category),
-            "General questions"
-        ) if domain_obj else "General questions"
-    
-    system_prompt = DOMAIN_PROMPTS.get(domain, f"You are an expert in {domain}.")
+async def create_message_with_backoff(
+    client: "anthropic.AsyncAnthropic",
+    sem: asyncio.Semaphore,
+    **params,
+):
+    """Call messages.create under the concurrency limit, retrying 429s with backoff."""
+    async with sem:
+        for attempt in range(MAX_RETRIES):
+            try:
+                return await client.messages.create(**params)
+            except anthropic.RateLimitError as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                retry_after = e.response.headers.get("retry-after") if e.response else None
+                delay = float(retry_after) if retry_after else min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+                print(f"  [RETRY] Rate limited, sleeping {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+def sample_categories(ctx: DomainContext, categories: Optional[List[str]], n_pairs: int) -> List[tuple]:
+    """Resolve (category_id, description) pairs for one call, sampling if none given."""
+    if categories is None:
+        return [random.choice(ctx.categories) for _ in range(n_pairs)]
+    return [(c, ctx.descriptions.get(c, "General questions")) for c in categories]
+
+
+def stratified_plan(ctx: DomainContext, count: int) -> List[str]:
+    """Category ids for count pairs, balanced across the domain's categories.
+
+    Every category appears count // n times; the remainder goes to distinct
+    randomly chosen categories, and the whole plan is shuffled.
+    """
+    ids = [c for c, _ in ctx.categories]
+    plan = ids * (count // len(ids)) + random.sample(ids, count % len(ids))
+    random.shuffle(plan)
+    return plan
+
+
+def build_message_params(ctx: DomainContext, sampled: List[tuple], examples: Optional[List[Dict]] = None) -> Dict:
+    """messages.create parameters for one multi-pair generation call."""
     user_prompt = GENERATION_TEMPLATE.format(
-        domain=domain,
-        category=category,
-        category_desc=cat_desc
+        category_lines="\n".join(f"- {c}: {desc}" for c, desc in sampled),
+        n_pairs=len(sampled),
     )
-    
+    if examples:
+        # Kept in the user turn so the cached system block stays byte-identical
+        user_prompt = EXAMPLES_TEMPLATE.format(examples=json.dumps(examples, indent=2)) + user_prompt
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS_PER_PAIR * len(sampled),
+        "system": ctx.system,
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+
+
+def parse_pairs(
+    content: str,
+    domain: str,
+    categories: List[str],
+    required: tuple = ("prompt", "response_a", "response_b"),
+) -> List[Dict]:
+    """Extract and validate preference pairs from a Claude response."""
     try:
-        response = client.messages.create(
-            model=MODEL,
-            max_tokens=2000,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}]
-        )
-        
-        # Extract JSON from response
-        content = response.content[0].text
-        
-        # Find JSON in response
+        # Fast path: the prompt asks for bare JSON
+        data = json_loads(content)
+    except ValueError:
+        # Salvage JSON wrapped in prose or fences
         start = content.find('{')
         end = content.rfind('}') + 1
         if start == -1 or end == 0:
             print(f"  [ERROR] No JSON found in response")
-            return None
-        
-        json_str = content[start:end]
-        data = json.loads(json_str)
-        
-        # Validate required fields
-        required = ["prompt", "response_a", "response_b"]
-        if not all(k in data for k in required):
+            return []
+        try:
+            data = json_loads(content[start:end])
+        except ValueError as e:
+            print(f"  [ERROR] JSON parse error: {e}")
+            return []
+    if not isinstance(data, dict):
+        print(f"  [ERROR] Unexpected JSON shape")
+        return []
+    if not isinstance(data.get("pairs"), list):
+        print(f"  [ERROR] Response has no \"pairs\" list")
+        return []
+    
+    # Validate required fields; drop malformed pairs, keep the rest
+    pairs = []
+    for i, pair in enumerate(data["pairs"][:len(categories)]):
+        if not all(k in pair for k in required):
             print(f"  [ERROR] Missing required fields")
-            return None
-        
-        data["category"] = category
-        data["domain"] = domain
-        return data
-        
-    except json.JSONDecodeError as e:
-        print(f"  [ERROR] JSON parse error: {e}")
-        return None
+            continue
+        pair["category"] = categories[i]
+        pair["domain"] = domain
+        pairs.append(pair)
+    return pairs
+
+
+async def generate_baseline_responses(
+    client: "anthropic.AsyncAnthropic",
+    sem: asyncio.Semaphore,
+    pairs: List[Dict],
+    model: str,
+) -> List[Dict]:
+    """Fill in response_b for each pair with a plain answer from a smaller model.
+
+    Calls run concurrently; pairs whose baseline call fails are dropped.
+    """
+    async def answer(pair: Dict) -> Dict:
+        response = await create_message_with_backoff(
+            client, sem,
+            model=model,
+            max_tokens=BASELINE_MAX_TOKENS,
+            system=BASELINE_SYSTEM,
+            messages=[{"role": "user", "content": pair["prompt"]}],
+        )
+        pair["response_b"] = response.content[0].text
+        pair["response_b_model"] = model
+        return pair
+    
+    results = await asyncio.gather(*(answer(p) for p in pairs), return_exceptions=True)
+    for r in results:
+        if isinstance(r, Exception):
+            print(f"  [ERROR] Baseline response failed: {r}")
+    return [r for r in results if not isinstance(r, Exception)]
+
+
+async def generate_preference_claude(
+    client: "anthropic.AsyncAnthropic",
+    domain: str,
+    categories: Optional[List[str]] = None,
+    n_pairs: int = 1,
+    sem: Optional[asyncio.Semaphore] = None,
+    existing_hashes: Optional[set] = None,
+    dedup_retries: int = DEDUP_RETRIES,
+    ctx: Optional[DomainContext] = None,
+    cache: Optional[GenerationCache] = None,
+    cache_reuse_prob: float = 0.0,
+    response_b_model: Optional[str] = None,
+) -> List[Dict]:
+    """Generate one or more preference pairs in a single Claude call (one per category).
+
+    Pairs whose hash is already in existing_hashes are dropped and regenerated
+    with freshly sampled categories, up to dedup_retries times. With probability
+    cache_reuse_prob, cached generations for the sampled categories are sent as
+    few-shot seeds. If response_b_model is set, the main call writes only the
+    question and Response A, and Response B comes from that model.
+    """
+    if ctx is None:
+        ctx = build_domain_context(domain, expert_only=bool(response_b_model))
+    sampled = sample_categories(ctx, categories, n_pairs)
+    
+    examples = None
+    if cache and random.random() < cache_reuse_prob:
+        examples = [ex for ex in (cache.sample(ctx, c) for c, _ in sampled) if ex]
+    
+    if sem is None:
+        sem = asyncio.Semaphore(1)
+    
+    try:
+        response = await create_message_with_backoff(client, sem, **build_message_params(ctx, sampled, examples))
     except Exception as e:
         print(f"  [ERROR] API error: {e}")
-        return None
+        return []
+    
+    categories = [c for c, _ in sampled]
+    if ctx.expert_only:
+        pairs = parse_pairs(response.content[0].text, domain, categories, required=("prompt", "response_a"))
+        pairs = await generate_baseline_responses(client, sem, pairs, response_b_model or BASELINE_MODEL)
+    else:
+        pairs = parse_pairs(response.content[0].text, domain, categories)
+    fresh = drop_duplicates(pairs, existing_hashes)
+    if cache:
+        cache.put(ctx, fresh)
+    n_dupes = len(pairs) - len(fresh)
+    if n_dupes and dedup_retries > 0:
+        fresh += await generate_preference_claude(
+            client, domain, n_pairs=n_dupes, sem=sem,
+            existing_hashes=existing_hashes, dedup_retries=dedup_retries - 1, ctx=ctx,
+            cache=cache, cache_reuse_prob=cache_reuse_prob, response_b_model=response_b_model,
+        )
+    return fresh
 
 
-def submit_to_zuup(preference: Dict, api_key: str) -> bool:
-    """Submit generated preference to Zuup API."""
-    client = ZuupPreferenceClient(api_key=api_key)
+async def generate_offline_batch(
+    client: "anthropic.AsyncAnthropic",
+    domain: str,
+    call_plan: List[List[str]],
+    existing_hashes: Optional[set] = None,
+    ctx: Optional[DomainContext] = None,
+    cache: Optional[GenerationCache] = None,
+) -> List[List[Dict]]:
+    """Run all generation calls through the Message Batches API (half price, no RPM limits).
+
+    call_plan holds the category ids requested by each call.
+    """
+    if ctx is None:
+        ctx = build_domain_context(domain)
+    plan = {}
+    requests = []
+    for i, call_categories in enumerate(call_plan):
+        sampled = sample_categories(ctx, call_categories, len(call_categories))
+        custom_id = f"{domain}-{i}"
+        plan[custom_id] = [c for c, _ in sampled]
+        requests.append({"custom_id": custom_id, "params": build_message_params(ctx, sampled)})
     
-    result = client.log_preference(
+    batch = await client.messages.batches.create(requests=requests)
+    print(f"  Submitted message batch {batch.id} ({len(requests)} requests)")
+    
+    while batch.processing_status != "ended":
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await client.messages.batches.retrieve(batch.id)
+    
+    results = []
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            print(f"  [ERROR] {entry.custom_id}: {entry.result.type}")
+            continue
+        content = entry.result.message.content[0].text
+        fresh = drop_duplicates(parse_pairs(content, domain, plan[entry.custom_id]), existing_hashes)
+        if cache:
+            cache.put(ctx, fresh)
+        results.append(fresh)
+    return results
+
+
+async def submit_to_zuup(preference: Dict, client: AsyncZuupPreferenceClient) -> bool:
+    """Submit generated preference to Zuup API."""
+    result = await client.log_preference(
         domain=preference["domain"],
         category=preference.get("category", "general"),
         prompt=preference["prompt"],
@@ -266,13 +618,59 @@ def submit_to_zuup(preference: Dict, api_key: str) -> bool:
         preference="A",  # A is always better in our generation
         annotator_id="claude_generator_v1",
         response_a_model="claude_expert",
-        response_b_model="claude_baseline",
+        response_b_model=preference.get("response_b_model", "claude_baseline"),
         notes=f"Generated: {datetime.now().isoformat()}"
     )
     
     return result.success
 
 
+class JsonArrayWriter:
+    """Stream objects into a JSON array file laid out like json.dump(items, f, indent=2).
+
+    The file is only created once the first item arrives, so an empty run
+    leaves no file behind (as the old end-of-run json.dump did).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, obj):
+        if self._f is None:
+            self._f = open(self.path, 'w')
+            self._f.write("[")
+        self._f.write(",\n  " if self.count else "\n  ")
+        self._f.write(json.dumps(obj, indent=2).replace("\n", "\n  "))
+        self.count += 1
+
+    def close(self):
+        if self._f is not None:
+            self._f.write("\n]")
+            self._f.close()
+            self._f = None
+
+
+class CountingSink:
+    """output_sink that counts pairs and forwards them to an optional inner sink."""
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self.count = 0
+
+    def write(self, obj):
+        if self.sink is not None:
+            self.sink.write(obj)
+        self.count += 1
+
+
 async def generate_batch(
     domain: str,
     count: int,
@@ -280,77 +678,174 @@ async def generate_batch(
     submit: bool = True,
     output_file: str = None,
     output_dir: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    pairs_per_call: int = DEFAULT_PAIRS_PER_CALL,
+    offline_batch: bool = False,
+    existing_hashes: Optional[set] = None,
+    cache_reuse_prob: float = 0.0,
+    client: Optional["anthropic.AsyncAnthropic"] = None,
+    sem: Optional[asyncio.Semaphore] = None,
+    zuup: Optional[AsyncZuupPreferenceClient] = None,
+    response_b_model: Optional[str] = None,
+    output_sink=None,
 ) -> List[Dict]:
-    """Generate multiple preference pairs for a domain. Optionally append JSONL to output_dir."""
+    """Generate preference pairs for a domain and return the accepted pairs.
+
+    output_file (legacy) gets this batch's pairs as a JSON array. When
+    output_sink (a JsonArrayWriter or CountingSink) is given, each pair is
+    written to it instead of being kept, and an empty list is returned, so
+    main can stream a combined --output across domains. Pairs are appended to output_dir/{domain}_preferences.jsonl as
+    they arrive. existing_hashes (a set or the persisted Bloom
+    filter opened by main) is checked as each API call returns, so duplicates
+    are discarded before they are submitted or written. Accepted pairs are also
+    stored in output_dir/.gen_cache.sqlite for few-shot reuse.
+
+    client, sem and zuup let concurrent batches share one Anthropic client, one
+    global concurrency limit and one Zuup connection pool; each is created
+    locally when not given. response_b_model (live mode only) moves Response B
+    generation to a smaller model.
+    """
     
     if not HAS_ANTHROPIC or not ANTHROPIC_API_KEY:
         print("[ERROR] Anthropic API not configured")
         print("  Set ANTHROPIC_API_KEY environment variable")
         return []
     
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
     generated = []
-    submitted = 0
+    n_generated = 0
+    submit_tasks = []
+    appended = 0
+    
+    pending = []
     
-    print(f"\n=== Generating {count} preferences for {domain.upper()} ===")
+    def flush_pending():
+        """Write queued JSONL lines in one call and fsync them."""
+        if pending:
+            jsonl_file.writelines(pending)
+            pending.clear()
+            jsonl_file.flush()
+            os.fsync(jsonl_file.fileno())
     
-    for i in range(count):
-        print(f"  [{i+1}/{count}] Generating...", end=" ")
+    async with AsyncExitStack() as stack:
+        # A client created here is closed with the stack; a shared one belongs to the caller
+        if client is None:
+            client = await stack.enter_async_context(anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY))
+        
+        # Opened before the JSONL so it closes after the final flush and stamps the synced file
+        if existing_hashes is None and output_dir:
+            existing_hashes = stack.enter_context(open_domain_bloom(output_dir, domain, load_existing_hashes))
         
-        pref = await generate_preference_claude(client, domain)
+        # Append JSONL to domain-specific file (same schema as seed scripts) as pairs
+        # arrive, in batches of JSONL_FLUSH_EVERY; the flush callback also runs on
+        # error or Ctrl-C so at most one unsynced batch is ever at risk
+        jsonl_file = None
+        if output_dir:
+            out_path = Path(output_dir)
+            out_path.mkdir(parents=True, exist_ok=True)
+            jsonl_path = out_path / f"{domain}_preferences.jsonl"
+            jsonl_file = stack.enter_context(open(jsonl_path, 'ab'))
+            stack.callback(flush_pending)
         
-        if pref:
-            generated.append(pref)
-            print(f"[OK] {pref['prompt'][:40]}...")
+        batch_file = stack.enter_context(JsonArrayWriter(output_file)) if output_file else None
+        
+        cache = None
+        if output_dir:
+            cache = stack.enter_context(GenerationCache(Path(output_dir) / GEN_CACHE_FILE))
+        
+        # One pooled Zuup connection; submissions run in the background
+        if zuup is None and submit and api_key:
+            zuup = await stack.enter_async_context(AsyncZuupPreferenceClient(api_key=api_key))
+        
+        print(f"\n=== Generating {count} preferences for {domain.upper()} ===")
+        
+        # Category table and cached system block are built once, not per call
+        if offline_batch and response_b_model:
+            print("  [WARN] --response-b-model is not supported with --offline-batch; ignoring")
+            response_b_model = None
+        if not offline_batch and pairs_per_call > MAX_LIVE_PAIRS_PER_CALL:
+            print(f"  [WARN] --pairs-per-call {pairs_per_call} needs streaming; using {MAX_LIVE_PAIRS_PER_CALL}")
+            pairs_per_call = MAX_LIVE_PAIRS_PER_CALL
+        ctx = build_domain_context(domain, expert_only=bool(response_b_model))
+        
+        # Requests are network-bound: dispatch them all, the semaphore bounds in-flight calls
+        # Each call returns up to pairs_per_call pairs, amortizing prefill and round trip;
+        # categories follow a stratified plan so the batch covers them evenly
+        plan = stratified_plan(ctx, count)
+        call_plan = [plan[start:start + pairs_per_call] for start in range(0, count, pairs_per_call)]
+        
+        def accept(call_idx: int, prefs):
+            """Write, record and queue submission for one call's pairs."""
+            nonlocal appended, n_generated
+            if isinstance(prefs, Exception) or not prefs:
+                print(f"  [{domain} call {call_idx}/{len(call_plan)}] [FAILED]")
+                return
             
-            if submit and api_key:
-                if submit_to_zuup(pref, api_key):
-                    submitted += 1
-                    print(f"           -> Submitted to Zuup")
+            for pref in prefs:
+                if jsonl_file:
+                    # Already deduplicated against existing_hashes as results arrived
+                    pending.append(json_dumps_line(preference_to_jsonl_record(pref, n_generated)))
+                    appended += 1
+                    if len(pending) >= JSONL_FLUSH_EVERY:
+                        flush_pending()
+                if batch_file:
+                    batch_file.write(pref)
+                if output_sink is not None:
+                    output_sink.write(pref)
                 else:
-                    print(f"           -> Submit failed")
+                    generated.append(pref)
+                n_generated += 1
+                print(f"  [{domain} {n_generated}/{count}] [OK] {pref['prompt'][:40]}...")
+                
+                if submit and zuup:
+                    submit_tasks.append(asyncio.create_task(submit_to_zuup(pref, zuup)))
+        
+        if offline_batch:
+            results = await generate_offline_batch(client, domain, call_plan, existing_hashes, ctx=ctx, cache=cache)
+            for call_idx, prefs in enumerate(results, 1):
+                accept(call_idx, prefs)
         else:
-            print("[FAILED]")
+            if sem is None:
+                sem = asyncio.Semaphore(max_concurrency)
+            tasks = [
+                asyncio.create_task(generate_preference_claude(
+                    client, domain, categories=call_categories, n_pairs=len(call_categories), sem=sem,
+                    existing_hashes=existing_hashes, ctx=ctx,
+                    cache=cache, cache_reuse_prob=cache_reuse_prob, response_b_model=response_b_model,
+                ))
+                for call_categories in call_plan
+            ]
+            # Handle calls in completion order so writes and submits overlap in-flight calls
+            for n_done, fut in enumerate(asyncio.as_completed(tasks), 1):
+                try:
+                    prefs = await fut
+                except Exception as e:
+                    prefs = e
+                accept(n_done, prefs)
         
-        # Rate limiting
-        await asyncio.sleep(1)
+        # Drain outstanding submissions before the client closes
+        outcomes = await asyncio.gather(*submit_tasks, return_exceptions=True)
+        submitted = sum(1 for ok in outcomes if ok is True)
+        if len(outcomes) > submitted:
+            print(f"  [WARN] {len(outcomes) - submitted} Zuup submissions failed")
     
-    # Save to single JSON file if requested (legacy)
-    if output_file and generated:
-        with open(output_file, 'w') as f:
-            json.dump(generated, f, indent=2)
-        print(f"\n  Saved {len(generated)} preferences to {output_file}")
+    if batch_file and batch_file.count:
+        print(f"\n  Saved {batch_file.count} preferences to {output_file}")
     
-    # Append JSONL to domain-specific file (same schema as seed scripts)
-    if output_dir and generated:
-        out_path = Path(output_dir)
-        out_path.mkdir(parents=True, exist_ok=True)
-        jsonl_path = out_path / f"{domain}_preferences.jsonl"
-        existing_hashes = set()
-        if jsonl_path.exists():
-            with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        rec = json.loads(line.strip())
-                        if rec.get("record_hash"):
-                            existing_hashes.add(rec["record_hash"])
-                    except Exception:
-                        pass
-        appended = 0
-        with open(jsonl_path, 'a', encoding='utf-8') as f:
-            for idx, pref in enumerate(generated):
-                record = preference_to_jsonl_record(pref, idx)
-                if record["record_hash"] in existing_hashes:
-                    continue
-                f.write(json.dumps(record) + "\n")
-                existing_hashes.add(record["record_hash"])
-                appended += 1
+    if jsonl_file:
         print(f"\n  Appended {appended} preferences to {jsonl_path}")
     
-    print(f"\n  Summary: {len(generated)} generated, {submitted} submitted")
+    print(f"\n  Summary: {n_generated} generated, {submitted} submitted")
     return generated
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {n}")
+    return n
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate preferences using Claude")
     parser.add_argument("--domain", type=str, help="Single domain to generate for")
@@ -360,7 +855,12 @@ def main():
     parser.add_argument("--api-key", type=str, help="Zuup API key for submission")
     parser.add_argument("--no-submit", action="store_true", help="Generate only, don't submit")
     parser.add_argument("--output", type=str, help="Save combined generated preferences to a single JSON file")
+    parser.add_argument("--max-concurrency", type=positive_int, default=DEFAULT_MAX_CONCURRENCY, help="Max in-flight Claude requests (default: 10)")
+    parser.add_argument("--pairs-per-call", type=positive_int, default=DEFAULT_PAIRS_PER_CALL, help="Preference pairs requested per Claude call (default: 5; at most 10 without --offline-batch)")
+    parser.add_argument("--offline-batch", action="store_true", help="Use the Message Batches API (50%% cost, results within 24h)")
     parser.add_argument("--output-dir", type=str, default=str(DEFAULT_OUTPUT_DIR), help="Directory for per-domain JSONL files (default: preference_data)")
+    parser.add_argument("--response-b-model", type=str, help=f"Generate Response B with a separate, cheaper model (e.g. {BASELINE_MODEL})")
+    parser.add_argument("--cache-reuse-prob", type=float, default=0.0, help="Chance a call is seeded with cached generations as few-shot examples (default: 0)")
     args = parser.parse_args()
 
     if not HAS_ANTHROPIC:
@@ -397,27 +897,62 @@ def main():
         print("Specify --domain, --all-priority, or --all-domains")
         return
 
+    combined = None
+
+    async def run_all() -> List[int]:
+        """Run every domain concurrently on one loop, sharing client, limit and Zuup pool."""
+        nonlocal combined
+        sem = asyncio.Semaphore(args.max_concurrency)
+        async with AsyncExitStack() as stack:
+            # Shared by every domain; closed after all batches finish, like the Zuup pool
+            client = await stack.enter_async_context(anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY))
+            # Combined JSON array of every domain's pairs, written as they are accepted
+            if args.output:
+                combined = stack.enter_context(JsonArrayWriter(args.output))
+
+            # Dedup state per domain, opened before any API call is paid for: the
+            # persisted Bloom filter avoids rescanning each JSONL on every run
+            existing_hashes = {
+                d: stack.enter_context(open_domain_bloom(args.output_dir, d, load_existing_hashes))
+                if args.output_dir else set()
+                for d in domains
+            }
+            zuup = None
+            if submit:
+                zuup = await stack.enter_async_context(AsyncZuupPreferenceClient(api_key=api_key))
+
+            async def run_domain(domain: str) -> int:
+                # Pairs stream to the JSONL and --output; only the count is kept
+                sink = CountingSink(combined)
+                await generate_batch(
+                    domain=domain,
+                    count=args.count,
+                    api_key=api_key,
+                    submit=submit,
+                    output_dir=args.output_dir,
+                    max_concurrency=args.max_concurrency,
+                    pairs_per_call=args.pairs_per_call,
+                    offline_batch=args.offline_batch,
+                    existing_hashes=existing_hashes[domain],
+                    cache_reuse_prob=args.cache_reuse_prob,
+                    client=client,
+                    sem=sem,
+                    zuup=zuup,
+                    response_b_model=args.response_b_model,
+                    output_sink=sink,
+                )
+                return sink.count
+
+            return await asyncio.gather(*[run_domain(d) for d in domains])
+
     # Generate (each domain batch writes its own JSONL when output_dir is set)
-    all_generated = []
-    for domain in domains:
-        results = asyncio.run(generate_batch(
-            domain=domain,
-            count=args.count,
-            api_key=api_key,
-            submit=submit,
-            output_file=None,
-            output_dir=args.output_dir,
-        ))
-        all_generated.extend(results)
-
-    # Save combined JSON if requested
-    if args.output and all_generated:
-        with open(args.output, 'w') as f:
-            json.dump(all_generated, f, indent=2)
-        print(f"\nSaved {len(all_generated)} total preferences to {args.output}")
+    total = sum(asyncio.run(run_all()))
+
+    if combined and combined.count:
+        print(f"\nSaved {combined.count} total preferences to {args.output}")
 
     print(f"\n=== Complete ===")
-    print(f"Total generated: {len(all_generated)}")
+    print(f"Total generated: {total}")
 
 
 if __name__ == "__main__":
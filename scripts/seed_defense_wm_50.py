@@ -1,16 +1,41 @@
 """
 50 synthetic defense_wm (Orb) preferences for DPO cold-start.
 Run: python scripts/seed_defense_wm_50.py
+     SEED_FORMAT=msgpack python scripts/seed_defense_wm_50.py  # length-prefixed msgpack frames
 """
 
 import httpx
 import asyncio
 import json
 import os
+import re
+import sys
+import mmap
 import hashlib
+from itertools import chain
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2: pip install 'httpx[http2]')
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+from bloom_filter import BloomFilter
+
 # Import preferences from category files
 from defense_wm_preferences_3d_reconstruction import RECONSTRUCTION_PREFS
 from defense_wm_preferences_isr_analysis import ISR_PREFS
@@ -19,148 +44,345 @@ from defense_wm_preferences_sensor_fusion import SENSOR_FUSION_PREFS
 
 API_BASE = "https://zuup1-zuup-preference-collection.hf.space"
 API_KEY = os.getenv("ZUUP_API_KEY", "zuup-seed-key")
+API_CONCURRENCY = 16  # in-flight POSTs over one pooled client
 
 # Local mode: save directly to JSONL file
 LOCAL_MODE = os.getenv("LOCAL_MODE", "true").lower() == "true"
 DATA_DIR = Path(__file__).parent.parent / "preference_data"
 
-# Combine all preferences
-DEFENSE_WM_PREFERENCES = (
-    RECONSTRUCTION_PREFS +  # 13 items
-    ISR_PREFS +             # 12 items
-    GEOSPATIAL_PREFS +      # 13 items
-    SENSOR_FUSION_PREFS     # 12 items
-)  # Total: 50 items
+# Local output format: "jsonl" (read by training/export) or "msgpack"
+# (4-byte big-endian length + msgpack payload per record; needs msgspec)
+SEED_FORMAT = os.getenv("SEED_FORMAT", "jsonl").lower()
+
+# Combine all preferences (one pass, no intermediate lists)
+DEFENSE_WM_PREFERENCES = list(chain(
+    RECONSTRUCTION_PREFS,   # 13 items
+    ISR_PREFS,              # 12 items
+    GEOSPATIAL_PREFS,       # 13 items
+    SENSOR_FUSION_PREFS,    # 12 items
+))  # Total: 50 items
+
+
+# Fields shared by every seed record, built once at import
+DIMENSION_SCORES = {"accuracy": 5, "completeness": 5, "clarity": 5, "relevance": 5}
+METADATA_BASE = {"source": "synthetic", "generator": "seed_defense_wm_50_v1"}
+
+
+def json_bytes(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj).encode("utf-8")
+
+
+def hash_fields(prompt: str, response_a: str, response_b: str) -> str:
+    """sha256(prompt + response_a + response_b).hexdigest()[:12], without concatenating."""
+    h = hashlib.sha256(prompt.encode())
+    h.update(response_a.encode())
+    h.update(response_b.encode())
+    return h.digest()[:6].hex()
+
+
+def pref_hash(pref: dict) -> str:
+    """record_hash of the record a seed preference becomes, computed from the seed itself."""
+    return hash_fields(pref["prompt"], pref["chosen"], pref["rejected"])
+
+
+RECORD_HASH_RE = re.compile(rb'"record_hash":\s*"([0-9a-f]+)"')
+BLOOM_THRESHOLD = 100_000  # existing records before the exact set becomes a Bloom filter
+
+
+def collect_hashes(hashes):
+    """Exact set for small files; past BLOOM_THRESHOLD, an in-memory Bloom filter.
+
+    Bloom hits may be false positives; load_existing_hashes() confirms them.
+    """
+    seen = set()
+    for h in hashes:
+        seen.add(h)
+        if len(seen) >= BLOOM_THRESHOLD:
+            bloom = BloomFilter()
+            bloom.update(seen)
+            bloom.update(hashes)
+            return bloom
+    return seen
+
+
+def iter_jsonl_hashes(filepath: Path):
+    """Yield record_hash values by scanning raw bytes, without parsing records."""
+    if not filepath.exists() or filepath.stat().st_size == 0:
+        return
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        for m in RECORD_HASH_RE.finditer(buf):
+            yield m.group(1).decode()
+
+
+def load_existing_hashes(scan, wanted: set) -> set:
+    """Hashes in wanted that are already stored; scan() yields the stored hashes.
+
+    A Bloom false positive depends only on the hash, so it would skip the same
+    record on every run: Bloom hits are confirmed by a second scan that keeps
+    only those hashes.
+    """
+    existing = collect_hashes(scan())
+    if isinstance(existing, set):
+        return existing
+    hits = {h for h in wanted if h in existing}
+    return {h for h in scan() if h in hits} if hits else set()
+
+
+# build_record() + record_hash as one JSON line, pre-rendered except for the per-record
+# fields; these are filled with already-escaped JSON fragments, skipping the dict walk
+JSONL_TEMPLATE = (
+    b'{"domain":"defense_wm","category":%b,"prompt":%b,"response_a":%b,"response_b":%b,'
+    b'"preference":"A","annotator_id":"synthetic_seed_v1","dimension_scores":'
+    + json_bytes(DIMENSION_SCORES)
+    + b',"metadata":' + json_bytes(METADATA_BASE)[:-1]
+    + b',"batch_index":%d,"generated_at":%b},"record_hash":"%b"}'
+)
+
+
+def render_jsonl_record(i: int, pref: dict, generated_at_json: bytes, record_hash: str) -> bytes:
+    """Fill JSONL_TEMPLATE for one seed; generated_at_json is the pre-escaped timestamp."""
+    return JSONL_TEMPLATE % (
+        json_bytes(pref["category"]),
+        json_bytes(pref["prompt"]),
+        json_bytes(pref["chosen"]),
+        json_bytes(pref["rejected"]),
+        i,
+        generated_at_json,
+        record_hash.encode(),
+    )
+
+
+if HAS_MSGSPEC:
+    class PreferenceRecord(msgspec.Struct):
+        """build_record() schema as a msgspec Struct; encodes as the same map."""
+        domain: str
+        category: str
+        prompt: str
+        response_a: str
+        response_b: str
+        preference: str
+        annotator_id: str
+        dimension_scores: dict
+        metadata: dict
+        record_hash: str = ""
+
+
+def build_record(i: int, pref: dict, generated_at: str) -> dict:
+    """Preference record for one seed item, as stored locally and sent to the API."""
+    return {
+        "domain": "defense_wm",
+        "category": pref["category"],
+        "prompt": pref["prompt"],
+        "response_a": pref["chosen"],
+        "response_b": pref["rejected"],
+        "preference": "A",
+        "annotator_id": "synthetic_seed_v1",
+        "dimension_scores": DIMENSION_SCORES,
+        "metadata": {**METADATA_BASE, "batch_index": i, "generated_at": generated_at},
+    }
+
+
+IOV_MAX = 1024  # max buffers per writev call on Linux/macOS
+
+
+def append_chunks(filepath: Path, chunks: list):
+    """Append byte chunks to a file with scatter-gather writes, then fsync once.
+
+    One writev covers up to IOV_MAX fragments, so a seeding run costs a handful
+    of syscalls; io_uring or O_DIRECT would not cut that further for appends to
+    a single file (O_DIRECT also needs block-aligned, unbuffered writes).
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if not hasattr(os, "writev"):  # Windows
+            chunks = [b"".join(chunks)]
+        i = 0
+        while i < len(chunks):
+            if hasattr(os, "writev"):
+                n = os.writev(fd, chunks[i:i + IOV_MAX])
+            else:
+                n = os.write(fd, chunks[i])
+            # Skip fully written chunks; keep the tail of a partially written one
+            while i < len(chunks) and n >= len(chunks[i]):
+                n -= len(chunks[i])
+                i += 1
+            if n:
+                chunks[i] = chunks[i][n:]
+        os.fsync(fd)  # once per batch, not per record
+    finally:
+        os.close(fd)
 
 
-def generate_hash(record: dict) -> str:
-    """Generate a unique hash for a preference record."""
-    content = f"{record['prompt']}{record['response_a']}{record['response_b']}"
-    return hashlib.sha256(content.encode()).hexdigest()[:12]
+def read_msgpack_records(filepath: Path):
+    """Yield (end offset, record) from a length-prefixed msgpack file, one frame at a time.
+
+    The last end offset yielded is where the complete frames stop; a torn tail past it
+    is reported and skipped.
+    """
+    decoder = msgspec.msgpack.Decoder(dict)
+    with open(filepath, 'rb') as f:
+        while header := f.read(4):
+            offset = f.tell() - len(header)
+            size = int.from_bytes(header, "big")
+            body = f.read(size) if len(header) == 4 else b""
+            if len(header) < 4 or len(body) < size:
+                # Torn final frame from an interrupted append: keep the complete ones
+                print(f"[WARN] Truncated msgpack frame at byte {offset} in {filepath}; ignoring tail")
+                return
+            yield f.tell(), decoder.decode(body)
+
+
+def local_output_path() -> Path:
+    """Local seed file for the configured SEED_FORMAT."""
+    suffix = "msgpack" if SEED_FORMAT == "msgpack" else "jsonl"
+    return DATA_DIR / f"defense_wm_preferences.{suffix}"
 
 
 def save_local(preferences: list) -> dict:
-    """Save preferences directly to local JSONL file."""
+    """Save preferences directly to the local JSONL (or msgpack) file."""
     results = {"success": 0, "failed": 0, "errors": []}
     
     DATA_DIR.mkdir(exist_ok=True)
-    filepath = DATA_DIR / "defense_wm_preferences.jsonl"
+    filepath = local_output_path()
     
-    # Read existing hashes to avoid duplicates
-    existing_hashes = set()
-    if filepath.exists():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                try:
-                    rec = json.loads(line.strip())
-                    if rec.get("record_hash"):
-                        existing_hashes.add(rec["record_hash"])
-                except:
-                    pass
+    generated_at = datetime.now(timezone.utc).isoformat()  # one timestamp per seeding run
+    wanted = {pref_hash(pref) for pref in preferences}
     
-    with open(filepath, 'a', encoding='utf-8') as f:
-        for i, pref in enumerate(preferences):
-            record = {
-                "domain": "defense_wm",
-                "category": pref["category"],
-                "prompt": pref["prompt"],
-                "response_a": pref["chosen"],
-                "response_b": pref["rejected"],
-                "preference": "A",
-                "annotator_id": "synthetic_seed_v1",
-                "dimension_scores": {
-                    "accuracy": 5,
-                    "completeness": 5,
-                    "clarity": 5,
-                    "relevance": 5
-                },
-                "metadata": {
-                    "source": "synthetic",
-                    "generator": "seed_defense_wm_50_v1",
-                    "batch_index": i,
-                    "generated_at": datetime.now(timezone.utc).isoformat()
-                }
-            }
-            
-            record["record_hash"] = generate_hash(record)
-            
-            if record["record_hash"] in existing_hashes:
-                print(f"[SKIP] [{i+1}/50] Duplicate: {pref['prompt'][:40]}...")
-                continue
-            
-            try:
-                f.write(json.dumps(record) + "\n")
-                results["success"] += 1
-                print(f"[OK] [{i+1}/50] {pref['category']}: {pref['prompt'][:50]}...")
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append({"index": i, "error": str(e)})
-                print(f"[ERR] [{i+1}/50] Error: {e}")
+    if SEED_FORMAT == "msgpack":
+        if not HAS_MSGSPEC:
+            raise RuntimeError("SEED_FORMAT=msgpack requires msgspec: pip install msgspec")
+        
+        def encode(i: int, pref: dict, record_hash: str) -> tuple:
+            payload = msgspec.msgpack.encode(PreferenceRecord(
+                domain="defense_wm",
+                category=pref["category"],
+                prompt=pref["prompt"],
+                response_a=pref["chosen"],
+                response_b=pref["rejected"],
+                preference="A",
+                annotator_id="synthetic_seed_v1",
+                dimension_scores=DIMENSION_SCORES,
+                metadata={**METADATA_BASE, "batch_index": i, "generated_at": generated_at},
+                record_hash=record_hash,
+            ))
+            return len(payload).to_bytes(4, "big"), payload
+        
+        good_end = 0
+        
+        def record_hashes():
+            nonlocal good_end
+            for good_end, rec in read_msgpack_records(filepath):
+                yield rec["record_hash"]
+        
+        existing_hashes = load_existing_hashes(record_hashes, wanted) if filepath.exists() else set()
+        if filepath.exists() and filepath.stat().st_size > good_end:
+            # Drop the torn tail so new frames follow the last complete one
+            os.truncate(filepath, good_end)
+    else:
+        generated_at_json = json_bytes(generated_at)
+        
+        def encode(i: int, pref: dict, record_hash: str) -> tuple:
+            return render_jsonl_record(i, pref, generated_at_json, record_hash), b"\n"
+        
+        # Read existing hashes to avoid duplicates
+        existing_hashes = load_existing_hashes(lambda: iter_jsonl_hashes(filepath), wanted)
+    
+    def prepare(item: tuple) -> tuple:
+        """(record_hash, encoded fragments, error) for one preference."""
+        i, pref = item
+        record_hash = pref_hash(pref)
+        if record_hash in existing_hashes:
+            return record_hash, None, None  # duplicate: skip building the record
+        try:
+            return record_hash, encode(i, pref, record_hash), None
+        except Exception as e:
+            return record_hash, None, e
+    
+    prepared = list(map(prepare, enumerate(preferences)))
+    
+    # Collect every record's byte fragments, then append them with one gather write;
+    # progress lines are buffered too and written to stdout in one call
+    chunks = []
+    log_lines = []
+    for i, (pref, (record_hash, fragments, error)) in enumerate(zip(preferences, prepared)):
+        if record_hash in existing_hashes:
+            log_lines.append(f"[SKIP] [{i+1}/50] Duplicate: {pref['prompt'][:40]}...\n")
+            continue
+        
+        if error:
+            results["failed"] += 1
+            results["errors"].append({"index": i, "error": str(error)})
+            log_lines.append(f"[ERR] [{i+1}/50] Error: {error}\n")
+            continue
+        
+        chunks.extend(fragments)
+        results["success"] += 1
+        log_lines.append(f"[OK] [{i+1}/50] {pref['category']}: {pref['prompt'][:50]}...\n")
+    
+    append_chunks(filepath, chunks)
+    sys.stdout.write("".join(log_lines))
     
     return results
 
 
-async def submit_preferences_api():
-    """Submit all preferences to the API."""
-    async with httpx.AsyncClient(timeout=60) as client:
-        results = {"success": 0, "failed": 0, "errors": []}
+async def submit_preferences_api(preferences: list):
+    """Submit preferences to the API, API_CONCURRENCY requests at a time."""
+    results = {"success": 0, "failed": 0, "errors": []}
+    generated_at = datetime.now(timezone.utc).isoformat()  # one timestamp per seeding run
+    sem = asyncio.Semaphore(API_CONCURRENCY)
+    
+    async with httpx.AsyncClient(
+        base_url=API_BASE,
+        headers={"X-API-Key": API_KEY, "Content-Type": "application/json"},
+        timeout=60,
+        limits=httpx.Limits(max_connections=API_CONCURRENCY, max_keepalive_connections=API_CONCURRENCY),
+        http2=HAS_HTTP2,  # multiplex all POSTs over one connection when h2 is installed
+    ) as client:
         
-        for i, pref in enumerate(DEFENSE_WM_PREFERENCES):
-            try:
-                response = await client.post(
-                    f"{API_BASE}/api/preferences",
-                    headers={"X-API-Key": API_KEY},
-                    json={
-                        "domain": "defense_wm",
-                        "category": pref["category"],
-                        "prompt": pref["prompt"],
-                        "response_a": pref["chosen"],
-                        "response_b": pref["rejected"],
-                        "preference": "A",
-                        "annotator_id": "synthetic_seed_v1",
-                        "dimension_scores": {
-                            "accuracy": 5,
-                            "completeness": 5,
-                            "clarity": 5,
-                            "relevance": 5
-                        },
-                        "metadata": {
-                            "source": "synthetic",
-                            "generator": "seed_defense_wm_50_v1",
-                            "batch_index": i,
-                            "generated_at": datetime.now(timezone.utc).isoformat()
-                        }
-                    }
-                )
-                
-                if response.status_code == 200:
-                    results["success"] += 1
-                    print(f"[OK] [{i+1}/50] {pref['category']}: {pref['prompt'][:50]}...")
-                else:
+        async def submit_one(i: int, pref: dict):
+            async with sem:
+                try:
+                    response = await client.post(
+                        "/api/preferences",
+                        content=json_bytes(build_record(i, pref, generated_at)),
+                    )
+                except Exception as e:
                     results["failed"] += 1
-                    results["errors"].append({
-                        "index": i,
-                        "status": response.status_code,
-                        "response": response.text[:200]
-                    })
-                    print(f"[FAIL] [{i+1}/50] Failed: {response.status_code}")
-                    
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append({"index": i, "error": str(e)})
-                print(f"[ERR] [{i+1}/50] Error: {e}")
+                    results["errors"].append({"index": i, "error": str(e)})
+                    print(f"[ERR] [{i+1}/{len(preferences)}] Error: {e}")
+                    return
             
-            await asyncio.sleep(0.1)
+            if response.status_code == 200:
+                results["success"] += 1
+                print(f"[OK] [{i+1}/{len(preferences)}] {pref['category']}: {pref['prompt'][:50]}...")
+            else:
+                results["failed"] += 1
+                results["errors"].append({
+                    "index": i,
+                    "status": response.status_code,
+                    "response": response.text[:200]
+                })
+                print(f"[FAIL] [{i+1}/{len(preferences)}] Failed: {response.status_code}")
         
-        return results
+        await asyncio.gather(*(submit_one(i, pref) for i, pref in enumerate(preferences)))
+    
+    # Completion order is arbitrary; report errors in record order
+    results["errors"].sort(key=lambda err: err["index"])
+    return results
+
+
+def _submit_api_sync(preferences: list) -> dict:
+    return asyncio.run(submit_preferences_api(preferences))
+
+
+# Submission strategy, chosen once from LOCAL_MODE at import
+_submit_impl = save_local if LOCAL_MODE else _submit_api_sync
 
 
 def submit_preferences():
     """Submit preferences - locally or via API based on mode."""
-    if LOCAL_MODE:
-        return save_local(DEFENSE_WM_PREFERENCES)
-    else:
-        return asyncio.run(submit_preferences_api())
+    return _submit_impl(DEFENSE_WM_PREFERENCES)
 
 
 def main():
@@ -172,9 +394,9 @@ def main():
     print(f"  - Sensor Fusion: {len(SENSOR_FUSION_PREFS)}")
     
     if LOCAL_MODE:
-        print(f"Writing to: {DATA_DIR / 'defense_wm_preferences.jsonl'}")
+        print(f"Writing to: {local_output_path()}")
     else:
-        print(f"API: {API_BASE}")
+        print(f"API: {API_BASE} ({'HTTP/2' if HAS_HTTP2 else 'HTTP/1.1'})")
     print("=" * 60)
     
     results = submit_preferences()
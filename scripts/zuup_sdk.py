@@ -172,17 +172,35 @@ class ZuupPreferenceClient:
 
 # Async version for high-throughput integrations
 class AsyncZuupPreferenceClient:
-    """Async client for Zuup Preference Collection API."""
+    """Async client for Zuup Preference Collection API.
+    
+    Use as ``async with AsyncZuupPreferenceClient(...) as client:`` to share one
+    pooled connection across many submissions.
+    """
     
     def __init__(
         self, 
         base_url: str = "https://zuup1-zuup-preference-collection.hf.space",
         api_key: Optional[str] = None,
         timeout: float = 10.0,
+        max_connections: int = 32,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self) -> "AsyncZuupPreferenceClient":
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self._client.aclose()
+        self._client = None
     
     def _headers(self) -> Dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -223,15 +241,22 @@ class AsyncZuupPreferenceClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.post(
+            if self._client is not None:
+                resp = await self._client.post(
                     f"{self.base_url}/api/preferences",
                     json=payload,
                     headers=self._headers(),
                 )
-                resp.raise_for_status()
-                data = resp.json()
-                return PreferenceResult(success=True, hash=data.get("hash"))
+            else:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    resp = await client.post(
+                        f"{self.base_url}/api/preferences",
+                        json=payload,
+                        headers=self._headers(),
+                    )
+            resp.raise_for_status()
+            data = resp.json()
+            return PreferenceResult(success=True, hash=data.get("hash"))
         except Exception as e:
             return PreferenceResult(success=False, error=str(e))
 
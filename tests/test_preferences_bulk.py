@@ -0,0 +1,84 @@
+"""Tests for the bulk preference submission endpoint."""
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("gradio")
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+def _item(domain: str, prompt: str) -> dict:
+    return {
+        "domain": domain,
+        "category": "general",
+        "prompt": prompt,
+        "response_a": "A",
+        "response_b": "B",
+        "preference": "A",
+    }
+
+
+def _lines(path) -> list:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module.store, "data_dir", tmp_path)
+    monkeypatch.setattr(app_module, "API_KEYS", set())
+    return TestClient(app_module.app)
+
+
+@pytest.fixture
+def domains():
+    return list(app_module.DOMAINS)[:2]
+
+
+def test_bulk_saves_every_item(client, tmp_path, domains):
+    d1 = domains[0]
+    resp = client.post("/api/preferences/bulk", json={"items": [_item(d1, "p1"), _item(d1, "p2")]})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["saved"] == 2
+    saved = _lines(tmp_path / f"{d1}_preferences.jsonl")
+    assert [r["prompt"] for r in saved] == ["p1", "p2"]
+    assert [r["record_hash"] for r in saved] == body["hashes"]
+
+
+def test_bulk_rejects_invalid_domain_before_saving(client, tmp_path, domains):
+    d1 = domains[0]
+    resp = client.post("/api/preferences/bulk", json={"items": [_item(d1, "p1"), _item("no_such_domain", "p2")]})
+
+    assert resp.status_code == 400
+    assert "item 1" in resp.json()["detail"]
+    assert _lines(tmp_path / f"{d1}_preferences.jsonl") == []
+
+
+def test_bulk_multi_domain_writes_each_domain_file(client, tmp_path, domains):
+    d1, d2 = domains
+    items = [_item(d1, "p1"), _item(d2, "p2"), _item(d1, "p3")]
+    resp = client.post("/api/preferences/bulk", json={"items": items})
+
+    assert resp.status_code == 200
+    assert [r["prompt"] for r in _lines(tmp_path / f"{d1}_preferences.jsonl")] == ["p1", "p3"]
+    assert [r["prompt"] for r in _lines(tmp_path / f"{d2}_preferences.jsonl")] == ["p2"]
+
+
+def test_bulk_multi_domain_failure_rolls_back_earlier_domains(client, tmp_path, domains):
+    d1, d2 = domains
+    d1_path = tmp_path / f"{d1}_preferences.jsonl"
+    d1_path.write_text(json.dumps({"prompt": "existing"}) + "\n", encoding="utf-8")
+    before = d1_path.read_bytes()
+    # A directory where d2's JSONL should be makes the second domain write fail
+    (tmp_path / f"{d2}_preferences.jsonl").mkdir()
+
+    resp = client.post("/api/preferences/bulk", json={"items": [_item(d1, "p1"), _item(d2, "p2")]})
+
+    assert resp.status_code == 500
+    assert d1_path.read_bytes() == before